@@ -0,0 +1,25 @@
+"""
+Endpoint paths for the FOGIS API.
+
+Paths are relative to FogisApiClient.BASE_URL. They are joined at call time
+rather than stored as full URLs, because BASE_URL can be overridden (for example
+to point the client at a mock server).
+"""
+
+LOGIN = "/Login.aspx?ReturnUrl=%2fmdk%2f"
+
+# MatchWebMetoder.aspx page methods
+GET_MATCHES_TO_REPORT = "/MatchWebMetoder.aspx/GetMatcherAttRapportera"
+GET_MATCH = "/MatchWebMetoder.aspx/GetMatch"
+GET_MATCH_PLAYERS = "/MatchWebMetoder.aspx/GetMatchdeltagareLista"
+GET_MATCH_OFFICIALS = "/MatchWebMetoder.aspx/GetMatchfunktionarerLista"
+GET_MATCH_EVENTS = "/MatchWebMetoder.aspx/GetMatchhandelselista"
+GET_TEAM_PLAYERS = "/MatchWebMetoder.aspx/GetMatchdeltagareListaForMatchlag"
+GET_TEAM_OFFICIALS = "/MatchWebMetoder.aspx/GetMatchlagledareListaForMatchlag"
+GET_MATCH_RESULTS = "/MatchWebMetoder.aspx/GetMatchresultatlista"
+SAVE_MATCH_EVENT = "/MatchWebMetoder.aspx/SparaMatchhandelse"
+SAVE_MATCH_RESULTS = "/MatchWebMetoder.aspx/SparaMatchresultatLista"
+SAVE_TEAM_OFFICIAL_ACTION = "/MatchWebMetoder.aspx/SparaMatchlagledare"
+DELETE_MATCH_EVENT = "/MatchWebMetoder.aspx/RaderaMatchhandelse"
+CLEAR_MATCH_EVENTS = "/MatchWebMetoder.aspx/ClearMatchEvents"
+MARK_REPORTING_FINISHED = "/MatchWebMetoder.aspx/SparaMatchGodkannDomarrapport"
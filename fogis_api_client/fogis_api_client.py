@@ -1,11 +1,13 @@
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Union, cast
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
+from fogis_api_client import endpoints
 from fogis_api_client.event_types import EVENT_TYPES  # noqa: F401
 from fogis_api_client.types import MatchListResponse  # noqa: F401
 from fogis_api_client.types import (
@@ -19,6 +21,56 @@ from fogis_api_client.types import (
     TeamPlayersResponse,
 )
 
+# Decodes response bodies (bytes) and the 'd' envelope (str).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only catch the latter
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    from orjson import loads as _orjson_loads  # Faster JSON decoding, optional
+
+    _json_loads = _orjson_loads
+except ImportError:
+    # orjson is optional; fall back to the standard library parser
+    _json_loads = json.loads
+
+# Invariant part of the default fetch_matches_list_json filter; date fields are added per call.
+# Tuples serialize to the same JSON arrays as lists but cannot be mutated by callers.
+_DEFAULT_MATCH_LIST_FILTER: Dict[str, Any] = {
+    "datumTyp": 0,
+    "typ": "alla",
+    "status": ("avbruten", "uppskjuten", "installd"),
+    "alderskategori": (1, 2, 3, 4, 5),
+    "kon": (3, 2, 4),
+}
+
+# Fields sent as integers by the report_* methods; string values are coerced with int()
+_EVENT_INT_FIELDS = frozenset(
+    {
+        "matchid",
+        "handelsekod",
+        "minut",
+        "lagid",
+        "personid",
+        "assisterandeid",
+        "period",
+        "resultatHemma",
+        "resultatBorta",
+    }
+)
+_RESULT_INT_FIELDS = frozenset(
+    {"matchid", "hemmamal", "bortamal", "halvtidHemmamal", "halvtidBortamal"}
+)
+_OFFICIAL_ACTION_INT_FIELDS = frozenset(
+    {"matchid", "lagid", "personid", "matchlagledaretypid", "minut"}
+)
+
+
+def _coerce_int_fields(data: Dict[str, Any], int_fields: frozenset) -> Dict[str, Any]:
+    """Return a copy of data with string values of int_fields converted to int."""
+    return {
+        key: int(value) if key in int_fields and isinstance(value, str) else value
+        for key, value in data.items()
+    }
+
 
 # Custom exceptions
 class FogisLoginError(Exception):
@@ -88,7 +140,8 @@ class FogisApiClient:
         logger (logging.Logger): Logger instance for this class
         username (Optional[str]): FOGIS username if provided
         password (Optional[str]): FOGIS password if provided
-        session (requests.Session): HTTP session for making requests
+        session (requests.Session): HTTP session for making requests. Each client has
+            its own session (and cookie jar), but all sessions share one connection pool
         cookies (Optional[CookieDict]): Session cookies for authentication
     """
 
@@ -96,6 +149,10 @@ class FogisApiClient:
         "https://fogis.svenskfotboll.se/mdk"  # Define base URL as a class constant
     )
     logger: logging.Logger = logging.getLogger("fogis_api_client.api")
+    # Connection pool shared by every client instance; cookies stay per-session.
+    # Its pool_maxsize (10 connections per host) is one limit for all clients in the
+    # process: connections opened beyond it are still made, but not kept for reuse.
+    _http_adapter: ClassVar[HTTPAdapter] = HTTPAdapter()
 
     def __init__(
         self,
@@ -132,6 +189,10 @@ class FogisApiClient:
         self.username: Optional[str] = username
         self.password: Optional[str] = password
         self.session: requests.Session = requests.Session()
+        # Session() still builds its own default adapters; mounting replaces them, so the
+        # connections this client opens are pooled in the shared adapter
+        self.session.mount("https://", self._http_adapter)
+        self.session.mount("http://", self._http_adapter)
         self.cookies: Optional[CookieDict] = None
 
         # If cookies are provided, use them directly
@@ -145,6 +206,36 @@ class FogisApiClient:
         elif not (username and password):
             raise ValueError("Either username and password OR cookies must be provided")
 
+    def close(self) -> None:
+        """
+        Closes the HTTP session used by the client.
+
+        The connection pool shared between clients is left open; only this
+        client's session is released.
+
+        Examples:
+            >>> client = FogisApiClient(username="your_username", password="your_password")
+            >>> matches = client.fetch_matches_list_json()
+            >>> client.close()
+        """
+        # Unmount the shared adapter first so Session.close() does not close its pool
+        self.session.adapters.clear()
+        self.session.close()
+
+    def __enter__(self) -> "FogisApiClient":
+        """
+        Enables use of the client as a context manager that closes its session on exit.
+
+        Examples:
+            >>> with FogisApiClient(username="your_username", password="your_password") as client:
+            ...     matches = client.fetch_matches_list_json()
+        """
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        """Closes the client's session when leaving the with block."""
+        self.close()
+
     def login(self) -> CookieDict:
         """
         Logs into the FOGIS API and stores the session cookies.
@@ -178,7 +269,7 @@ class FogisApiClient:
             self.logger.error(error_msg)
             raise FogisLoginError(error_msg)
 
-        login_url = f"{FogisApiClient.BASE_URL}/Login.aspx?ReturnUrl=%2fmdk%2f"
+        login_url = f"{FogisApiClient.BASE_URL}{endpoints.LOGIN}"
 
         # Define headers for better browser simulation
         headers = {
@@ -189,7 +280,7 @@ class FogisApiClient:
             "Content-Type": "application/x-www-form-urlencoded",
             "Host": "fogis.svenskfotboll.se",
             "Origin": "https://fogis.svenskfotboll.se",
-            "Referer": f"{FogisApiClient.BASE_URL}/Login.aspx?ReturnUrl=%2fmdk%2f",
+            "Referer": f"{FogisApiClient.BASE_URL}{endpoints.LOGIN}",
             "User-Agent": (
                 "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
                 "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
@@ -349,32 +440,24 @@ class FogisApiClient:
             ... })
         """
         # Use the correct endpoint URL that works in v0.0.5
-        url = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatcherAttRapportera"
-
-        # Build the default payload with the same structure as v0.0.5
-        today = datetime.today().strftime("%Y-%m-%d")
-        default_datum_fran = (datetime.today() - timedelta(days=7)).strftime(
-            "%Y-%m-%d"
-        )  # One week ago
-        default_datum_till = (datetime.today() + timedelta(days=365)).strftime(
-            "%Y-%m-%d"
-        )  # 365 days ahead
-
-        payload_filter = {  # Build DEFAULT payload dictionary
+        url = f"{FogisApiClient.BASE_URL}{endpoints.GET_MATCHES_TO_REPORT}"
+
+        # Build the default payload with the same structure as v0.0.5.
+        # Read the clock once so all three dates agree even across midnight.
+        now = datetime.today()
+        today = now.strftime("%Y-%m-%d")
+        default_datum_fran = (now - timedelta(days=7)).strftime("%Y-%m-%d")  # One week ago
+        default_datum_till = (now + timedelta(days=365)).strftime("%Y-%m-%d")  # 365 days ahead
+
+        # Build DEFAULT payload dictionary, then apply any custom filter parameters
+        payload_filter = {
+            **_DEFAULT_MATCH_LIST_FILTER,
             "datumFran": default_datum_fran,
             "datumTill": default_datum_till,
-            "datumTyp": 0,
-            "typ": "alla",
-            "status": ["avbruten", "uppskjuten", "installd"],
-            "alderskategori": [1, 2, 3, 4, 5],
-            "kon": [3, 2, 4],
             "sparadDatum": today,
+            **(filter or {}),
         }
 
-        # Update with any custom filter parameters
-        if filter:
-            payload_filter.update(filter)
-
         # Wrap the filter in the expected payload structure
         payload = {"filter": payload_filter}
 
@@ -407,7 +490,7 @@ class FogisApiClient:
             >>> print(f"Match: {match['hemmalag']} vs {match['bortalag']}")
             Match: Home Team vs Away Team
         """
-        url = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatch"
+        url = f"{FogisApiClient.BASE_URL}{endpoints.GET_MATCH}"
         match_id_int = int(match_id) if isinstance(match_id, (str, int)) else match_id
         payload = {"matchid": match_id_int}
 
@@ -450,7 +533,7 @@ class FogisApiClient:
             ...       f"Away team has {len(away_players)} players")
             Home team has 18 players, Away team has 18 players
         """
-        url = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatchdeltagareLista"
+        url = f"{FogisApiClient.BASE_URL}{endpoints.GET_MATCH_PLAYERS}"
         match_id_int = int(match_id) if isinstance(match_id, (str, int)) else match_id
         payload = {"matchid": match_id_int}
 
@@ -495,9 +578,7 @@ class FogisApiClient:
             ...     print("No referee assigned yet")
             Main referee: John Doe
         """
-        url = (
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatchfunktionarerLista"
-        )
+        url = f"{FogisApiClient.BASE_URL}{endpoints.GET_MATCH_OFFICIALS}"
         match_id_int = int(match_id) if isinstance(match_id, (str, int)) else match_id
         payload = {"matchid": match_id_int}
 
@@ -537,7 +618,7 @@ class FogisApiClient:
             >>> print(f"Total events: {len(events)}, Goals: {len(goals)}")
             Total events: 15, Goals: 3
         """
-        url = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatchhandelselista"
+        url = f"{FogisApiClient.BASE_URL}{endpoints.GET_MATCH_EVENTS}"
         match_id_int = int(match_id) if isinstance(match_id, (str, int)) else match_id
         payload = {"matchid": match_id_int}
 
@@ -580,7 +661,7 @@ class FogisApiClient:
             Team has 22 players
             First player: John Doe
         """
-        url = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatchdeltagareListaForMatchlag"
+        url = f"{FogisApiClient.BASE_URL}{endpoints.GET_TEAM_PLAYERS}"
         team_id_int = int(team_id) if isinstance(team_id, (str, int)) else team_id
         payload = {"matchlagid": team_id_int}
 
@@ -626,7 +707,7 @@ class FogisApiClient:
             Team has 3 officials
             Number of coaches: 1
         """
-        url = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatchlagledareListaForMatchlag"
+        url = f"{FogisApiClient.BASE_URL}{endpoints.GET_TEAM_OFFICIALS}"
         team_id_int = int(team_id) if isinstance(team_id, (str, int)) else team_id
         payload = {"matchlagid": team_id_int}
 
@@ -685,7 +766,7 @@ class FogisApiClient:
             >>> print(f"Event reported successfully: {response.get('success', False)}")
             Event reported successfully: True
         """
-        url = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/SparaMatchhandelse"
+        url = f"{FogisApiClient.BASE_URL}{endpoints.SAVE_MATCH_EVENT}"
 
         # Ensure required fields are present
         required_fields = ["matchid", "handelsekod", "minut", "lagid"]
@@ -695,27 +776,10 @@ class FogisApiClient:
                 self.logger.error(error_msg)
                 raise ValueError(error_msg)
 
-        # Create a copy to avoid modifying the original
-        event_data_copy = dict(event_data)
-
-        # Ensure numeric fields are integers
-        for field in [
-            "matchid",
-            "handelsekod",
-            "minut",
-            "lagid",
-            "personid",
-            "assisterandeid",
-            "period",
-            "resultatHemma",
-            "resultatBorta",
-        ]:
-            if field in event_data_copy and event_data_copy[field] is not None:
-                value = event_data_copy[field]
-                if isinstance(value, str):
-                    event_data_copy[field] = int(value)
-                elif isinstance(value, int):
-                    event_data_copy[field] = value
+        # Copy the data (the original is not modified) with numeric fields as integers
+        event_data_copy = _coerce_int_fields(
+            cast(Dict[str, Any], event_data), _EVENT_INT_FIELDS
+        )
 
         response_data = self._api_request(url, event_data_copy)
 
@@ -756,9 +820,7 @@ class FogisApiClient:
             ...     print(f"Multiple results found: {len(result)}")
             Score: 2-1
         """
-        result_url = (
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatchresultatlista"
-        )
+        result_url = f"{FogisApiClient.BASE_URL}{endpoints.GET_MATCH_RESULTS}"
         match_id_int = int(match_id) if isinstance(match_id, (str, int)) else match_id
         payload = {"matchid": match_id_int}
 
@@ -820,27 +882,12 @@ class FogisApiClient:
                 self.logger.error(error_msg)
                 raise ValueError(error_msg)
 
-        # Create a copy to avoid modifying the original
-        result_data_copy = dict(result_data)
-
-        # Ensure numeric fields are integers
-        for field in [
-            "matchid",
-            "hemmamal",
-            "bortamal",
-            "halvtidHemmamal",
-            "halvtidBortamal",
-        ]:
-            if field in result_data_copy and result_data_copy[field] is not None:
-                value = result_data_copy[field]
-                if isinstance(value, str):
-                    result_data_copy[field] = int(value)
-                elif isinstance(value, int):
-                    result_data_copy[field] = value
-
-        result_url = (
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/SparaMatchresultatLista"
+        # Copy the data (the original is not modified) with numeric fields as integers
+        result_data_copy = _coerce_int_fields(
+            cast(Dict[str, Any], result_data), _RESULT_INT_FIELDS
         )
+
+        result_url = f"{FogisApiClient.BASE_URL}{endpoints.SAVE_MATCH_RESULTS}"
         response_data = self._api_request(result_url, result_data_copy)
 
         if isinstance(response_data, dict):
@@ -879,7 +926,7 @@ class FogisApiClient:
             ...     print(f"Event deletion {'successful' if success else 'failed'}")
             Event deletion successful
         """
-        url = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/RaderaMatchhandelse"
+        url = f"{FogisApiClient.BASE_URL}{endpoints.DELETE_MATCH_EVENT}"
 
         # Ensure event_id is an integer
         event_id_int = int(event_id) if isinstance(event_id, str) else event_id
@@ -959,21 +1006,12 @@ class FogisApiClient:
                 self.logger.error(error_msg)
                 raise ValueError(error_msg)
 
-        # Create a copy to avoid modifying the original
-        action_data_copy = dict(action_data)
-
-        # Ensure IDs are integers
-        for key in ["matchid", "lagid", "personid", "matchlagledaretypid", "minut"]:
-            if key in action_data_copy and action_data_copy[key] is not None:
-                value = action_data_copy[key]
-                if isinstance(value, str):
-                    action_data_copy[key] = int(value)
-                elif isinstance(value, int):
-                    action_data_copy[key] = value
-
-        action_url = (
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/SparaMatchlagledare"
+        # Copy the data (the original is not modified) with IDs as integers
+        action_data_copy = _coerce_int_fields(
+            cast(Dict[str, Any], action_data), _OFFICIAL_ACTION_INT_FIELDS
         )
+
+        action_url = f"{FogisApiClient.BASE_URL}{endpoints.SAVE_TEAM_OFFICIAL_ACTION}"
         response_data = self._api_request(action_url, action_data_copy)
 
         if isinstance(response_data, dict):
@@ -1013,7 +1051,7 @@ class FogisApiClient:
 
         self.logger.info(f"Clearing all events for match ID {match_id}")
         response_data = self._api_request(
-            url=f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/ClearMatchEvents",
+            url=f"{FogisApiClient.BASE_URL}{endpoints.CLEAR_MATCH_EVENTS}",
             payload=payload,
         )
 
@@ -1062,12 +1100,14 @@ class FogisApiClient:
             # that requires authentication
             self.logger.debug("Validating session cookies")
             self._api_request(
-                url=f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatcherAttRapportera",
+                url=f"{FogisApiClient.BASE_URL}{endpoints.GET_MATCHES_TO_REPORT}",
                 method="GET",
             )
             self.logger.debug("Session cookies are valid")
             return True
-        except (FogisLoginError, FogisAPIRequestError):
+        except (FogisLoginError, FogisAPIRequestError, FogisDataError):
+            # An expired session may be answered with the HTML login page,
+            # which fails to parse as JSON
             self.logger.info("Cookies are no longer valid")
             return False
 
@@ -1153,7 +1193,7 @@ class FogisApiClient:
 
         self.logger.info(f"Marking match ID {match_id} reporting as finished")
         response_data = self._api_request(
-            url=f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/SparaMatchGodkannDomarrapport",
+            url=f"{FogisApiClient.BASE_URL}{endpoints.MARK_REPORTING_FINISHED}",
             payload=payload,
         )
 
@@ -1175,6 +1215,29 @@ class FogisApiClient:
             self.logger.error(error_msg)
             raise FogisDataError(error_msg)
 
+    def _get_api_headers(self) -> Dict[str, str]:
+        """
+        Returns the headers for API requests, with the client's current cookies.
+
+        Returns:
+            Dict[str, str]: The headers to send with each API request
+        """
+        api_headers = {
+            "Content-Type": "application/json; charset=UTF-8",
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "Origin": "https://fogis.svenskfotboll.se",
+            "Referer": f"{FogisApiClient.BASE_URL}/",
+            "X-Requested-With": "XMLHttpRequest",
+        }
+
+        # Add cookies to headers if available
+        if self.cookies:
+            api_headers["Cookie"] = "; ".join(
+                [f"{key}={value}" for key, value in self.cookies.items()]
+            )
+
+        return api_headers
+
     def _api_request(
         self, url: str, payload: Optional[Dict[str, Any]] = None, method: str = "POST"
     ) -> Union[Dict[str, Any], List[Dict[str, Any]], str]:
@@ -1221,20 +1284,7 @@ class FogisApiClient:
                 self.logger.error(error_msg)
                 raise FogisLoginError(error_msg)
 
-        # Prepare headers for the API request
-        api_headers = {
-            "Content-Type": "application/json; charset=UTF-8",
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-            "Origin": "https://fogis.svenskfotboll.se",
-            "Referer": f"{FogisApiClient.BASE_URL}/",
-            "X-Requested-With": "XMLHttpRequest",
-        }
-
-        # Add cookies to headers if available
-        if self.cookies:
-            api_headers["Cookie"] = "; ".join(
-                [f"{key}={value}" for key, value in self.cookies.items()]
-            )
+        api_headers = self._get_api_headers()
 
         try:
             self.logger.debug(f"Making {method} request to {url}")
@@ -1249,39 +1299,40 @@ class FogisApiClient:
 
             response.raise_for_status()
 
-            # Parse the response JSON
-            response_json = response.json()
+            # Parse the response JSON straight from the raw body bytes
+            response_json = _json_loads(response.content)
             self.logger.debug(f"Received response from {url}")
 
             # FOGIS API returns data in a 'd' key
             if "d" in response_json:
-                # The 'd' value is a JSON string that needs to be parsed again
-                if isinstance(response_json["d"], str):
-                    try:
-                        return json.loads(response_json["d"])
-                    except json.JSONDecodeError:
-                        # If it's not valid JSON, return as is
-                        self.logger.debug(
-                            "Response 'd' value is not valid JSON, returning as string"
-                        )
-                        return response_json["d"]
-                else:
-                    # If 'd' is already a dict/list, return it directly
+                data = response_json["d"]
+                # If 'd' is already a dict/list, return it directly without a second parse
+                if not isinstance(data, str):
                     self.logger.debug(
                         "Response 'd' value is already parsed, returning directly"
                     )
-                    return response_json["d"]
+                    return data
+                # The 'd' value is a JSON string that needs to be parsed again
+                try:
+                    return _json_loads(data)
+                except json.JSONDecodeError:
+                    # If it's not valid JSON, return as is
+                    self.logger.debug(
+                        "Response 'd' value is not valid JSON, returning as string"
+                    )
+                    return data
             else:
                 self.logger.debug(
                     "Response does not contain 'd' key, returning full response"
                 )
                 return response_json
 
-        except requests.exceptions.RequestException as e:
-            error_msg = f"API request failed: {e}"
-            self.logger.error(error_msg)
-            raise FogisAPIRequestError(error_msg)
+        # Checked first: requests' JSONDecodeError is also a RequestException
         except json.JSONDecodeError as e:
             error_msg = f"Failed to parse API response: {e}"
             self.logger.error(error_msg)
             raise FogisDataError(error_msg)
+        except requests.exceptions.RequestException as e:
+            error_msg = f"API request failed: {e}"
+            self.logger.error(error_msg)
+            raise FogisAPIRequestError(error_msg)
@@ -10,6 +10,122 @@ import random
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
 
+# First names used for generated people
+_FIRST_NAMES = (
+    "John",
+    "Jane",
+    "Alex",
+    "Sam",
+    "Chris",
+    "Pat",
+    "Taylor",
+    "Morgan",
+    "Jordan",
+    "Casey",
+)
+
+# Surnames used for generated people
+_SURNAMES = (
+    "Smith",
+    "Johnson",
+    "Williams",
+    "Brown",
+    "Jones",
+    "Miller",
+    "Davis",
+    "Garcia",
+    "Rodriguez",
+    "Wilson",
+)
+
+# Words combined into generated team names
+_TEAM_PREFIXES = (
+    "FC",
+    "United",
+    "City",
+    "Athletic",
+    "Sporting",
+    "Real",
+    "Inter",
+    "Dynamo",
+)
+_TEAM_LOCATIONS = (
+    "North",
+    "South",
+    "East",
+    "West",
+    "Central",
+    "Metro",
+    "Royal",
+    "Olympic",
+)
+
+# Pools for generated contact details
+_EMAIL_DOMAINS = ("example.com", "test.org", "sample.net", "mock.io", "demo.se")
+_STREETS = ("Main St", "Park Ave", "Oak Rd", "Maple Ln", "Cedar Blvd")
+_CITIES = (
+    "Springfield",
+    "Rivertown",
+    "Lakeside",
+    "Mountainview",
+    "Valleyfield",
+    "Brookhaven",
+)
+
+# Roles assigned to generated team officials, in order
+_OFFICIAL_ROLES = (
+    "Tränare",
+    "Assisterande tränare",
+    "Lagledare",
+    "Materialförvaltare",
+    "Fysioterapeut",
+)
+
+# Positions assigned to generated team players
+_PLAYER_POSITIONS = ("Målvakt", "Försvarare", "Mittfältare", "Anfallare")
+
+# Event types based on real data: (id, name, affects_score, requires_related_event)
+_EVENT_TYPES = (
+    (6, "Spelmål", True, False),  # Regular goal
+    (14, "Straffmål", True, False),  # Penalty goal
+    (29, "Frisparksmål (Direkt i mål)", True, False),  # Free kick goal
+    (20, "Varning", False, False),  # Yellow card
+    (21, "Utvisning", False, False),  # Red card
+    (16, "Byte ut", False, False),  # Substitution out
+    (17, "Byte in", False, True),  # Substitution in (related to "Byte ut")
+    (23, "Match slut", False, False),  # End of match
+)
+# Selection weights for _EVENT_TYPES; higher weight = more likely
+_EVENT_TYPE_WEIGHTS = (10, 5, 2, 8, 3, 8, 8, 0)
+
+# Fields with the same value on every generated match player and match official
+_MATCH_PLAYER_FIELDS = {
+    "__type": "Svenskfotboll.Fogis.Web.FogisMobilDomarKlient.MatchdeltagareJSON",
+    "agerestriction": "",
+    "lagdelid": 0,
+    "ejlicensieradibeslaktadforening": False,
+    "positionsnummerhv": 0,
+    "byte1": 0,  # Will be filled in for substituted players
+    "byte2": 0,
+    "utvisning": "",
+    "arSpelandeLedare": False,
+    "ansvarig": False,
+    "spelarregistreringsstrang": "",
+    "spelareAvstangningBeskrivning": "",
+}
+_MATCH_OFFICIAL_FIELDS = {
+    "__type": "Svenskfotboll.Fogis.Web.FogisMobilDomarKlient.MatchlagledareJSON",
+    "avvisadmatchminut": 0,
+    "avvisadlindrig": False,
+    "avvisadgrov": False,
+    "varnad": False,
+    "varnadmatchminut": 0,
+    "ledareAntalAckumuleradeVarningar": 0,
+    "ledareAvstangningBeskrivning": "",
+}
+# (lagrollid, lagrollnamn) of the officials generated for each team in a match
+_MATCH_OFFICIAL_ROLES = ((1, "Tränare"), (2, "Assisterande tränare"), (3, "Lagledare"))
+
 
 class MockDataFactory:
     """Factory for generating sample data for the mock FOGIS API server."""
@@ -28,33 +144,9 @@ class MockDataFactory:
     def generate_name(first_name: bool = True) -> str:
         """Generate a random name."""
         if first_name:
-            names = [
-                "John",
-                "Jane",
-                "Alex",
-                "Sam",
-                "Chris",
-                "Pat",
-                "Taylor",
-                "Morgan",
-                "Jordan",
-                "Casey",
-            ]
-            return random.choice(names)
+            return random.choice(_FIRST_NAMES)
         else:
-            surnames = [
-                "Smith",
-                "Johnson",
-                "Williams",
-                "Brown",
-                "Jones",
-                "Miller",
-                "Davis",
-                "Garcia",
-                "Rodriguez",
-                "Wilson",
-            ]
-            return random.choice(surnames)
+            return random.choice(_SURNAMES)
 
     @staticmethod
     def generate_full_name() -> str:
@@ -64,27 +156,7 @@ class MockDataFactory:
     @staticmethod
     def generate_team_name() -> str:
         """Generate a random team name."""
-        prefixes = [
-            "FC",
-            "United",
-            "City",
-            "Athletic",
-            "Sporting",
-            "Real",
-            "Inter",
-            "Dynamo",
-        ]
-        locations = [
-            "North",
-            "South",
-            "East",
-            "West",
-            "Central",
-            "Metro",
-            "Royal",
-            "Olympic",
-        ]
-        return f"{random.choice(locations)} {random.choice(prefixes)}"
+        return f"{random.choice(_TEAM_LOCATIONS)} {random.choice(_TEAM_PREFIXES)}"
 
     @staticmethod
     def generate_phone() -> str:
@@ -96,14 +168,12 @@ class MockDataFactory:
         """Generate a random email address."""
         if name is None:
             name = MockDataFactory.generate_full_name().lower().replace(" ", ".")
-        domains = ["example.com", "test.org", "sample.net", "mock.io", "demo.se"]
-        return f"{name}@{random.choice(domains)}"
+        return f"{name}@{random.choice(_EMAIL_DOMAINS)}"
 
     @staticmethod
     def generate_address() -> str:
         """Generate a random address."""
-        streets = ["Main St", "Park Ave", "Oak Rd", "Maple Ln", "Cedar Blvd"]
-        return f"{random.randint(1, 999)} {random.choice(streets)}"
+        return f"{random.randint(1, 999)} {random.choice(_STREETS)}"
 
     @staticmethod
     def generate_postal_code() -> str:
@@ -113,15 +183,7 @@ class MockDataFactory:
     @staticmethod
     def generate_city() -> str:
         """Generate a random city name."""
-        cities = [
-            "Springfield",
-            "Rivertown",
-            "Lakeside",
-            "Mountainview",
-            "Valleyfield",
-            "Brookhaven",
-        ]
-        return random.choice(cities)
+        return random.choice(_CITIES)
 
     @staticmethod
     def generate_date(future: bool = True, days_offset: Optional[int] = None) -> str:
@@ -154,6 +216,14 @@ class MockDataFactory:
         timestamp = MockDataFactory.generate_timestamp(future, days_offset)
         return f"\\/Date({timestamp})\\/"
 
+    @staticmethod
+    def generate_personal_number(min_year: int, max_year: int) -> str:
+        """Generate a random Swedish personal number (YYYYMMDDXXXX)."""
+        birth_year = random.randint(min_year, max_year)
+        birth_month = random.randint(1, 12)
+        birth_day = random.randint(1, 28)  # Simplified to avoid invalid dates
+        return f"{birth_year}{birth_month:02d}{birth_day:02d}{random.randint(1000, 9999)}"
+
     @staticmethod
     def generate_match_list(count: int = 5) -> Dict[str, Any]:
         """Generate a sample match list response."""
@@ -169,68 +239,23 @@ class MockDataFactory:
             match_time = MockDataFactory.generate_time()
 
             # Generate referee information
-            referees = []
-            for role_id, role_name, role_short in [
-                (1, "Huvuddomare", "Dom"),
-                (2, "Assisterande 1", "AD1"),
-                (3, "Assisterande 2", "AD2"),
-            ]:
-                referee_name = MockDataFactory.generate_full_name()
-                referees.append(
-                    {
-                        "domaruppdragid": MockDataFactory.generate_id(),
-                        "matchid": match_id,
-                        "matchnr": match_number,
-                        "domarrollid": role_id,
-                        "domarrollnamn": role_name,
-                        "domarrollkortnamn": role_short,
-                        "domareid": MockDataFactory.generate_id(),
-                        "domarnr": str(random.randint(10000, 99999)),
-                        "personid": MockDataFactory.generate_id(),
-                        "domaruppdragstatusid": 5,
-                        "domaruppdragstatusnamn": "Tilldelat",
-                        "personnamn": referee_name,
-                        "telefon": "",
-                        "mobiltelefon": MockDataFactory.generate_phone(),
-                        "telefonarbete": "",
-                        "adress": MockDataFactory.generate_address(),
-                        "coadress": "",
-                        "epostadress": MockDataFactory.generate_email(
-                            referee_name.lower().replace(" ", ".")
-                        ),
-                        "land": "Sverige",
-                        "namn": referee_name,
-                        "postnr": MockDataFactory.generate_postal_code(),
-                        "postort": MockDataFactory.generate_city(),
-                    }
+            referees = [
+                MockDataFactory._generate_match_referee(
+                    match_id, match_number, role_id, role_name, role_short
                 )
+                for role_id, role_name, role_short in [
+                    (1, "Huvuddomare", "Dom"),
+                    (2, "Assisterande 1", "AD1"),
+                    (3, "Assisterande 2", "AD2"),
+                ]
+            ]
 
-            # Generate contact persons
-            contacts = []
-            for team_name in [home_team, away_team]:
-                for is_reserve in [False, True]:
-                    contact_name = MockDataFactory.generate_full_name()
-                    contacts.append(
-                        {
-                            "lagid": MockDataFactory.generate_id(),
-                            "lagnamn": f"{team_name}",
-                            "personid": MockDataFactory.generate_id(),
-                            "personnamn": contact_name,
-                            "telefon": "",
-                            "mobiltelefon": MockDataFactory.generate_phone(),
-                            "telefonarbete": "",
-                            "adress": MockDataFactory.generate_address(),
-                            "coadress": "",
-                            "epostadress": MockDataFactory.generate_email(
-                                contact_name.lower().replace(" ", ".")
-                            ),
-                            "land": "Sverige",
-                            "postnr": MockDataFactory.generate_postal_code(),
-                            "postort": MockDataFactory.generate_city(),
-                            "reserv": is_reserve,
-                            "foreningId": MockDataFactory.generate_id(),
-                        }
-                    )
+            # Generate contact persons (main and reserve for each team)
+            contacts = [
+                MockDataFactory._generate_match_contact(team_name, is_reserve)
+                for team_name in [home_team, away_team]
+                for is_reserve in [False, True]
+            ]
 
             # Create the match object
             match = {
@@ -354,6 +379,63 @@ class MockDataFactory:
 
         return response
 
+    @staticmethod
+    def _generate_match_referee(
+        match_id: int, match_number: str, role_id: int, role_name: str, role_short: str
+    ) -> Dict[str, Any]:
+        """Generate one referee assignment of a match list entry."""
+        referee_name = MockDataFactory.generate_full_name()
+        return {
+            "domaruppdragid": MockDataFactory.generate_id(),
+            "matchid": match_id,
+            "matchnr": match_number,
+            "domarrollid": role_id,
+            "domarrollnamn": role_name,
+            "domarrollkortnamn": role_short,
+            "domareid": MockDataFactory.generate_id(),
+            "domarnr": str(random.randint(10000, 99999)),
+            "personid": MockDataFactory.generate_id(),
+            "domaruppdragstatusid": 5,
+            "domaruppdragstatusnamn": "Tilldelat",
+            "personnamn": referee_name,
+            "telefon": "",
+            "mobiltelefon": MockDataFactory.generate_phone(),
+            "telefonarbete": "",
+            "adress": MockDataFactory.generate_address(),
+            "coadress": "",
+            "epostadress": MockDataFactory.generate_email(
+                referee_name.lower().replace(" ", ".")
+            ),
+            "land": "Sverige",
+            "namn": referee_name,
+            "postnr": MockDataFactory.generate_postal_code(),
+            "postort": MockDataFactory.generate_city(),
+        }
+
+    @staticmethod
+    def _generate_match_contact(team_name: str, is_reserve: bool) -> Dict[str, Any]:
+        """Generate one contact person of a match list entry."""
+        contact_name = MockDataFactory.generate_full_name()
+        return {
+            "lagid": MockDataFactory.generate_id(),
+            "lagnamn": f"{team_name}",
+            "personid": MockDataFactory.generate_id(),
+            "personnamn": contact_name,
+            "telefon": "",
+            "mobiltelefon": MockDataFactory.generate_phone(),
+            "telefonarbete": "",
+            "adress": MockDataFactory.generate_address(),
+            "coadress": "",
+            "epostadress": MockDataFactory.generate_email(
+                contact_name.lower().replace(" ", ".")
+            ),
+            "land": "Sverige",
+            "postnr": MockDataFactory.generate_postal_code(),
+            "postort": MockDataFactory.generate_city(),
+            "reserv": is_reserve,
+            "foreningId": MockDataFactory.generate_id(),
+        }
+
     @staticmethod
     def generate_match_details(match_id: Optional[int] = None) -> Dict[str, Any]:
         """Generate sample match details."""
@@ -412,103 +494,39 @@ class MockDataFactory:
         home_team_club_id = MockDataFactory.generate_id()
         away_team_club_id = MockDataFactory.generate_id()
 
-        home_players = []
-        away_players = []
-
-        # Generate home team players
-        for i in range(18):
-            is_captain = i == 0
-            is_substitute = i >= 11  # First 11 are starters, rest are substitutes
-            jersey_number = i + 1
-
-            # Generate a random Swedish personal number (YYYYMMDDXXXX)
-            birth_year = random.randint(1990, 2005)
-            birth_month = random.randint(1, 12)
-            birth_day = random.randint(1, 28)  # Simplified to avoid invalid dates
-            personal_number = (
-                f"{birth_year}{birth_month:02d}{birth_day:02d}{random.randint(1000, 9999)}"
-            )
-
-            # Create player with the full structure from real data
-            player = {
-                "__type": "Svenskfotboll.Fogis.Web.FogisMobilDomarKlient.MatchdeltagareJSON",
-                "matchdeltagareid": MockDataFactory.generate_id(),
-                "matchid": match_id,
-                "matchlagid": home_team_id,
-                "spelareid": MockDataFactory.generate_id(),
-                "trojnummer": jersey_number,
-                "fornamn": MockDataFactory.generate_name(True),
-                "efternamn": MockDataFactory.generate_name(False),
-                "personnr": personal_number,
-                "agerestriction": "",
-                "matchlagnamn": home_team_name,
-                "lagdelid": 0,
-                "lagkapten": is_captain,
-                "ersattare": is_substitute,
-                "ejlicensieradibeslaktadforening": False,
-                "foreningid": home_team_club_id,
-                "positionsnummerhv": 0,
-                "byte1": 0,  # Will be filled in for substituted players
-                "byte2": 0,
-                "utvisning": "",
-                "arSpelandeLedare": False,
-                "ansvarig": False,
-                "spelarregistreringsstrang": "",
-                "spelareAntalAckumuleradeVarningar": random.randint(0, 2),
-                "spelareAvstangningBeskrivning": "",
-            }
+        return {
+            "hemmalag": MockDataFactory._generate_team_match_players(
+                match_id, home_team_id, home_team_name, home_team_club_id
+            ),
+            "bortalag": MockDataFactory._generate_team_match_players(
+                match_id, away_team_id, away_team_name, away_team_club_id
+            ),
+        }
 
-            home_players.append(player)
-
-        # Generate away team players
-        for i in range(18):
-            is_captain = i == 0
-            is_substitute = i >= 11  # First 11 are starters, rest are substitutes
-            jersey_number = i + 1
-
-            # Generate a random Swedish personal number (YYYYMMDDXXXX)
-            birth_year = random.randint(1990, 2005)
-            birth_month = random.randint(1, 12)
-            birth_day = random.randint(1, 28)  # Simplified to avoid invalid dates
-            personal_number = (
-                f"{birth_year}{birth_month:02d}{birth_day:02d}{random.randint(1000, 9999)}"
-            )
-
-            # Create player with the full structure from real data
-            player = {
-                "__type": "Svenskfotboll.Fogis.Web.FogisMobilDomarKlient.MatchdeltagareJSON",
+    @staticmethod
+    def _generate_team_match_players(
+        match_id: int, team_id: int, team_name: str, club_id: int
+    ) -> List[Dict[str, Any]]:
+        """Generate the 18 players of one team; the first 11 start and the first is captain."""
+        return [
+            {
+                **_MATCH_PLAYER_FIELDS,
                 "matchdeltagareid": MockDataFactory.generate_id(),
                 "matchid": match_id,
-                "matchlagid": away_team_id,
+                "matchlagid": team_id,
                 "spelareid": MockDataFactory.generate_id(),
-                "trojnummer": jersey_number,
+                "trojnummer": i + 1,
                 "fornamn": MockDataFactory.generate_name(True),
                 "efternamn": MockDataFactory.generate_name(False),
-                "personnr": personal_number,
-                "agerestriction": "",
-                "matchlagnamn": away_team_name,
-                "lagdelid": 0,
-                "lagkapten": is_captain,
-                "ersattare": is_substitute,
-                "ejlicensieradibeslaktadforening": False,
-                "foreningid": away_team_club_id,
-                "positionsnummerhv": 0,
-                "byte1": 0,  # Will be filled in for substituted players
-                "byte2": 0,
-                "utvisning": "",
-                "arSpelandeLedare": False,
-                "ansvarig": False,
-                "spelarregistreringsstrang": "",
+                "personnr": MockDataFactory.generate_personal_number(1990, 2005),
+                "matchlagnamn": team_name,
+                "lagkapten": i == 0,
+                "ersattare": i >= 11,
+                "foreningid": club_id,
                 "spelareAntalAckumuleradeVarningar": random.randint(0, 2),
-                "spelareAvstangningBeskrivning": "",
             }
-
-            away_players.append(player)
-
-        return {
-            "hemmalag": home_players,
-            "bortalag": away_players,
-        }
+            for i in range(18)
+        ]
 
     @staticmethod
     def generate_match_officials(
@@ -526,89 +544,39 @@ class MockDataFactory:
         home_team_club_id = MockDataFactory.generate_id()
         away_team_club_id = MockDataFactory.generate_id()
 
-        home_officials = []
-        away_officials = []
-
-        # Generate home team officials
-        for i, (role_id, role) in enumerate(
-            [(1, "Tränare"), (2, "Assisterande tränare"), (3, "Lagledare")]
-        ):
-            # Generate a random Swedish personal number (YYYYMMDDXXXX)
-            birth_year = random.randint(1960, 1990)  # Staff are typically older
-            birth_month = random.randint(1, 12)
-            birth_day = random.randint(1, 28)  # Simplified to avoid invalid dates
-            personal_number = (
-                f"{birth_year}{birth_month:02d}{birth_day:02d}{random.randint(1000, 9999)}"
-            )
-
-            # Create official with the full structure from real data
-            official = {
-                "__type": "Svenskfotboll.Fogis.Web.FogisMobilDomarKlient.MatchlagledareJSON",
-                "matchlagledareid": MockDataFactory.generate_id(),
-                "matchid": match_id,
-                "matchlagid": home_team_id,
-                "personid": MockDataFactory.generate_id(),
-                "fornamn": MockDataFactory.generate_name(True),
-                "efternamn": MockDataFactory.generate_name(False),
-                "personnr": personal_number,
-                "matchlagnamn": home_team_name,
-                "lagrollid": role_id,
-                "lagrollnamn": role,
-                "avvisadmatchminut": 0,
-                "avvisadlindrig": False,
-                "avvisadgrov": False,
-                "varnad": False,
-                "varnadmatchminut": 0,
-                "ansvarig": i == 0,  # First official is responsible
-                "foreningid": home_team_club_id,
-                "ledareAntalAckumuleradeVarningar": 0,
-                "ledareAvstangningBeskrivning": "",
-            }
+        return {
+            "hemmalag": MockDataFactory._generate_team_match_officials(
+                match_id, home_team_id, home_team_name, home_team_club_id
+            ),
+            "bortalag": MockDataFactory._generate_team_match_officials(
+                match_id, away_team_id, away_team_name, away_team_club_id
+            ),
+        }
 
-            home_officials.append(official)
-
-        # Generate away team officials
-        for i, (role_id, role) in enumerate(
-            [(1, "Tränare"), (2, "Assisterande tränare"), (3, "Lagledare")]
-        ):
-            # Generate a random Swedish personal number (YYYYMMDDXXXX)
-            birth_year = random.randint(1960, 1990)  # Staff are typically older
-            birth_month = random.randint(1, 12)
-            birth_day = random.randint(1, 28)  # Simplified to avoid invalid dates
-            personal_number = (
-                f"{birth_year}{birth_month:02d}{birth_day:02d}{random.randint(1000, 9999)}"
-            )
-
-            # Create official with the full structure from real data
-            official = {
-                "__type": "Svenskfotboll.Fogis.Web.FogisMobilDomarKlient.MatchlagledareJSON",
+    @staticmethod
+    def _generate_team_match_officials(
+        match_id: int, team_id: int, team_name: str, club_id: int
+    ) -> List[Dict[str, Any]]:
+        """Generate one team's officials, one per role; the first is responsible."""
+        return [
+            {
+                **_MATCH_OFFICIAL_FIELDS,
                 "matchlagledareid": MockDataFactory.generate_id(),
                 "matchid": match_id,
-                "matchlagid": away_team_id,
+                "matchlagid": team_id,
                 "personid": MockDataFactory.generate_id(),
                 "fornamn": MockDataFactory.generate_name(True),
                 "efternamn": MockDataFactory.generate_name(False),
-                "personnr": personal_number,
-                "matchlagnamn": away_team_name,
+                # Staff are typically older
+                "personnr": MockDataFactory.generate_personal_number(1960, 1990),
+                "matchlagnamn": team_name,
                 "lagrollid": role_id,
                 "lagrollnamn": role,
-                "avvisadmatchminut": 0,
-                "avvisadlindrig": False,
-                "avvisadgrov": False,
-                "varnad": False,
-                "varnadmatchminut": 0,
-                "ansvarig": i == 0,  # First official is responsible
-                "foreningid": away_team_club_id,
-                "ledareAntalAckumuleradeVarningar": 0,
-                "ledareAvstangningBeskrivning": "",
+                "ansvarig": i == 0,
+                "foreningid": club_id,
             }
-
-            away_officials.append(official)
-
-        return {
-            "hemmalag": home_officials,
-            "bortalag": away_officials,
-        }
+            for i, (role_id, role) in enumerate(_MATCH_OFFICIAL_ROLES)
+        ]
 
     @staticmethod
     def generate_match_events(
@@ -636,19 +604,6 @@ class MockDataFactory:
         # We'll create a timeline of events that makes sense for a football match
         timeline = sorted(random.sample(range(1, 90), min(count, 20)))
 
-        # Define event types based on real data
-        event_types = [
-            # (id, name, affects_score, requires_related_event)
-            (6, "Spelmål", True, False),  # Regular goal
-            (14, "Straffmål", True, False),  # Penalty goal
-            (29, "Frisparksmål (Direkt i mål)", True, False),  # Free kick goal
-            (20, "Varning", False, False),  # Yellow card
-            (21, "Utvisning", False, False),  # Red card
-            (16, "Byte ut", False, False),  # Substitution out
-            (17, "Byte in", False, True),  # Substitution in (related to "Byte ut")
-            (23, "Match slut", False, False),  # End of match
-        ]
-
         # Add a match end event at 90 minutes
         if count > 1:
             timeline.append(90)
@@ -669,11 +624,9 @@ class MockDataFactory:
                 participant_id = 0
             else:
                 # Select a random event type (weighted towards more common events)
-                weights = [10, 5, 2, 8, 3, 8, 8, 0]  # Higher weight = more likely
-                event_type_index = random.choices(range(len(event_types)), weights=weights, k=1)[0]
-                event_type_id, event_type_name, affects_score, requires_related = event_types[
-                    event_type_index
-                ]
+                event_type_id, event_type_name, affects_score, requires_related = random.choices(
+                    _EVENT_TYPES, weights=_EVENT_TYPE_WEIGHTS, k=1
+                )[0]
 
                 # For substitution in, we need a related "Byte ut" event
                 if requires_related and event_type_id == 17:  # Byte in
@@ -808,21 +761,14 @@ class MockDataFactory:
         if team_id is None:
             team_id = MockDataFactory.generate_id()
 
-        players = []
         # Generate 15-25 players
-        for _ in range(random.randint(15, 25)):
-            player_id = MockDataFactory.generate_id()
-            first_name = MockDataFactory.generate_name(True)
-            last_name = MockDataFactory.generate_name(False)
-            jersey_number = random.randint(1, 99)
-            position = random.choice(["Målvakt", "Försvarare", "Mittfältare", "Anfallare"])
-
-            player = {
-                "personid": player_id,
-                "fornamn": first_name,
-                "efternamn": last_name,
-                "tshirt": jersey_number,
-                "position": position,
+        players = [
+            {
+                "personid": MockDataFactory.generate_id(),
+                "fornamn": MockDataFactory.generate_name(True),
+                "efternamn": MockDataFactory.generate_name(False),
+                "tshirt": random.randint(1, 99),
+                "position": random.choice(_PLAYER_POSITIONS),
                 "matchlagid": team_id,
                 "fodelsedatum": MockDataFactory.generate_date(False),
                 "licensnummer": f"LIC{random.randint(100000, 999999)}",
@@ -830,8 +776,8 @@ class MockDataFactory:
                 "spelareAntalAckumuleradeVarningar": random.randint(0, 2),
                 "spelareAvstangningBeskrivning": "",
             }
-
-            players.append(player)
+            for _ in range(random.randint(15, 25))
+        ]
 
         return {"spelare": players}
 
@@ -841,33 +787,19 @@ class MockDataFactory:
         if team_id is None:
             team_id = MockDataFactory.generate_id()
 
-        officials = []
-        # Generate 2-5 officials
-        roles = [
-            "Tränare",
-            "Assisterande tränare",
-            "Lagledare",
-            "Materialförvaltare",
-            "Fysioterapeut",
-        ]
-
-        for i in range(random.randint(2, 5)):
-            official_id = MockDataFactory.generate_id()
-            first_name = MockDataFactory.generate_name(True)
-            last_name = MockDataFactory.generate_name(False)
-            role = roles[i % len(roles)]
-
-            official = {
-                "personid": official_id,
-                "fornamn": first_name,
-                "efternamn": last_name,
+        # Generate 2-5 officials, one per role (there are 5 roles)
+        officials = [
+            {
+                "personid": MockDataFactory.generate_id(),
+                "fornamn": MockDataFactory.generate_name(True),
+                "efternamn": MockDataFactory.generate_name(False),
                 "roll": role,
                 "matchlagid": team_id,
                 "fodelsedatum": MockDataFactory.generate_date(False),
                 "licensnummer": f"LIC{random.randint(100000, 999999)}",
             }
-
-            officials.append(official)
+            for role in _OFFICIAL_ROLES[: random.randint(2, 5)]
+        ]
 
         return officials
 
@@ -16,6 +16,39 @@ from fogis_api_client.types import CookieDict, EventDict
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Keys every item of each response type must contain, checked with one subset test
+REQUIRED_MATCH_KEYS = frozenset({"matchid", "hemmalag", "bortalag", "datum", "tid"})
+REQUIRED_PLAYER_KEYS = frozenset(
+    {
+        "matchdeltagareid",
+        "matchid",
+        "matchlagid",
+        "spelareid",
+        "trojnummer",
+        "fornamn",
+        "efternamn",
+    }
+)
+REQUIRED_OFFICIAL_KEYS = frozenset({"personid", "fornamn", "efternamn"})
+REQUIRED_EVENT_KEYS = frozenset(
+    {
+        "matchhandelseid",
+        "matchid",
+        "matchhandelsetypid",  # New field name instead of handelsekod
+        "matchhandelsetypnamn",  # New field name instead of handelsetyp
+        "matchminut",  # New field name instead of minut
+        "matchlagid",  # New field name instead of lagid
+    }
+)
+REQUIRED_RESULT_KEYS = frozenset({"matchid", "hemmamal", "bortamal"})
+REQUIRED_RESULT_LIST_KEYS = frozenset(
+    {"matchresultatid", "matchid", "matchlag1mal", "matchlag2mal"}
+)
+REQUIRED_TEAM_PLAYER_KEYS = frozenset(
+    {"personid", "fornamn", "efternamn", "position", "matchlagid"}
+)
+REQUIRED_TEAM_OFFICIAL_KEYS = frozenset({"personid", "fornamn", "efternamn", "roll", "matchlagid"})
+
 
 class TestFogisApiClientWithMockServer:
     """Integration tests for the FogisApiClient using a mock server."""
@@ -102,11 +135,7 @@ class TestFogisApiClientWithMockServer:
 
         # Check the structure of the first match
         match = test_match_data[0]
-        assert "matchid" in match
-        assert "hemmalag" in match
-        assert "bortalag" in match
-        assert "datum" in match
-        assert "tid" in match
+        assert REQUIRED_MATCH_KEYS <= match.keys()
 
     def test_fetch_match_details(
         self, mock_fogis_server: Dict[str, str], test_credentials: Dict[str, str]
@@ -128,15 +157,24 @@ class TestFogisApiClientWithMockServer:
         # Verify the response
         assert isinstance(match, dict)
         assert match["matchid"] == match_id
-        assert "hemmalag" in match
-        assert "bortalag" in match
-        assert "datum" in match
-        assert "tid" in match
-
-    def test_fetch_match_players(
-        self, mock_fogis_server: Dict[str, str], test_credentials: Dict[str, str]
+        assert REQUIRED_MATCH_KEYS <= match.keys()
+
+    @pytest.mark.parametrize(
+        "method_name, required_keys",
+        [
+            ("fetch_match_players_json", REQUIRED_PLAYER_KEYS),
+            ("fetch_match_officials_json", REQUIRED_OFFICIAL_KEYS),
+        ],
+        ids=["players", "officials"],
+    )
+    def test_fetch_match_participants(
+        self,
+        mock_fogis_server: Dict[str, str],
+        test_credentials: Dict[str, str],
+        method_name: str,
+        required_keys: frozenset,
     ):
-        """Test fetching match players."""
+        """Test fetching match players and officials, which share a per-team response shape."""
         # Override the base URL to use the mock server
         FogisApiClient.BASE_URL = f"{mock_fogis_server['base_url']}/mdk"
 
@@ -146,65 +184,18 @@ class TestFogisApiClientWithMockServer:
             password=test_credentials["password"],
         )
 
-        # Fetch match players
+        # Fetch match players or officials
         match_id = 12345
-        players = client.fetch_match_players_json(match_id)
+        participants = getattr(client, method_name)(match_id)
 
         # Verify the response
-        assert isinstance(players, dict)
-        assert "hemmalag" in players
-        assert "bortalag" in players
-        assert isinstance(players["hemmalag"], list)
-        assert isinstance(players["bortalag"], list)
-        assert len(players["hemmalag"]) > 0
-        assert len(players["bortalag"]) > 0
+        assert isinstance(participants, dict)
+        for team in ("hemmalag", "bortalag"):
+            assert isinstance(participants[team], list)
+            assert len(participants[team]) > 0
 
-        # Check the structure of the first player
-        home_player = players["hemmalag"][0]
-        assert "matchdeltagareid" in home_player
-        assert "matchid" in home_player
-        assert "matchlagid" in home_player
-        assert "spelareid" in home_player
-        assert "trojnummer" in home_player
-        assert "fornamn" in home_player
-        assert "efternamn" in home_player
-
-    def test_fetch_match_officials(
-        self, mock_fogis_server: Dict[str, str], test_credentials: Dict[str, str]
-    ):
-        """Test fetching match officials."""
-        # Override the base URL to use the mock server
-        FogisApiClient.BASE_URL = f"{mock_fogis_server['base_url']}/mdk"
-
-        # Create a client with test credentials
-        client = FogisApiClient(
-            username=test_credentials["username"],
-            password=test_credentials["password"],
-        )
-
-        # Fetch match officials
-        match_id = 12345
-        officials = client.fetch_match_officials_json(match_id)
-
-        # Verify the response
-        assert isinstance(officials, dict)
-        assert "hemmalag" in officials
-        assert "bortalag" in officials
-        assert isinstance(officials["hemmalag"], list)
-        assert isinstance(officials["bortalag"], list)
-        assert len(officials["hemmalag"]) > 0
-        assert len(officials["bortalag"]) > 0
-
-        # Check the structure of the officials response
-        assert "hemmalag" in officials
-        assert isinstance(officials["hemmalag"], list)
-        assert len(officials["hemmalag"]) > 0
-
-        # Check the structure of the first official
-        home_official = officials["hemmalag"][0]
-        assert "personid" in home_official
-        assert "fornamn" in home_official
-        assert "efternamn" in home_official
+        # Check the structure of the first home team entry
+        assert required_keys <= participants["hemmalag"][0].keys()
 
     def test_fetch_match_events(
         self, mock_fogis_server: Dict[str, str], test_credentials: Dict[str, str]
@@ -229,12 +220,7 @@ class TestFogisApiClientWithMockServer:
 
         # Check the structure of the first event
         event = events[0]
-        assert "matchhandelseid" in event
-        assert "matchid" in event
-        assert "matchhandelsetypid" in event  # New field name instead of handelsekod
-        assert "matchhandelsetypnamn" in event  # New field name instead of handelsetyp
-        assert "matchminut" in event  # New field name instead of minut
-        assert "matchlagid" in event  # New field name instead of lagid
+        assert REQUIRED_EVENT_KEYS <= event.keys()
 
     def test_fetch_match_result(
         self, mock_fogis_server: Dict[str, str], test_credentials: Dict[str, str]
@@ -256,16 +242,11 @@ class TestFogisApiClientWithMockServer:
         # Verify the response
         # The client can return either a dict or a list depending on the API response
         if isinstance(result, dict):
-            assert "matchid" in result
-            assert "hemmamal" in result
-            assert "bortamal" in result
+            assert REQUIRED_RESULT_KEYS <= result.keys()
         else:
             assert isinstance(result, list)
             assert len(result) > 0
-            assert "matchresultatid" in result[0]
-            assert "matchid" in result[0]
-            assert "matchlag1mal" in result[0]
-            assert "matchlag2mal" in result[0]
+            assert REQUIRED_RESULT_LIST_KEYS <= result[0].keys()
 
     def test_report_match_event(
         self, mock_fogis_server: Dict[str, str], test_credentials: Dict[str, str]
@@ -393,12 +374,8 @@ class TestFogisApiClientWithMockServer:
 
         # Check the structure of the first player
         player = players["spelare"][0]
-        assert "personid" in player
-        assert "fornamn" in player
-        assert "efternamn" in player
-        assert "position" in player
+        assert REQUIRED_TEAM_PLAYER_KEYS <= player.keys()
         # Note: matchlagid is not in PlayerDict but is present in the mock server response
-        assert "matchlagid" in player  # type: ignore
         assert player["matchlagid"] == team_id  # type: ignore
 
     def test_fetch_team_officials(
@@ -424,12 +401,8 @@ class TestFogisApiClientWithMockServer:
 
         # Check the structure of the first official
         official = officials[0]
-        assert "personid" in official
-        assert "fornamn" in official
-        assert "efternamn" in official
-        assert "roll" in official
+        assert REQUIRED_TEAM_OFFICIAL_KEYS <= official.keys()
         # Note: matchlagid is not in OfficialDict but is present in the mock server response
-        assert "matchlagid" in official  # type: ignore
         assert official["matchlagid"] == team_id  # type: ignore
 
     def test_cookie_authentication(self, mock_fogis_server: Dict[str, str]):
@@ -0,0 +1,18 @@
+"""Shared helpers for the unit tests."""
+
+import json
+from unittest.mock import Mock
+
+import requests
+
+
+def make_response(json_data, status_code=200):
+    """Create a mock requests.Response whose body is json_data encoded as JSON."""
+    response = Mock(spec=requests.Response)
+    response.status_code = status_code
+    response.content = json.dumps(json_data).encode("utf-8")
+    if 400 <= status_code < 600:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            f"HTTP Error {status_code}"
+        )
+    return response
@@ -1,7 +1,8 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import requests
+import requests_mock
 
 from fogis_api_client.fogis_api_client import FogisApiClient, FogisLoginError
 
@@ -50,14 +51,14 @@ class TestCookieAuth(unittest.TestCase):
         original_post = requests.Session.post
 
         # Create mock responses
-        mock_get_response = MagicMock()
+        mock_get_response = Mock(spec=requests.Response)
         mock_get_response.text = (
             '<input name="__VIEWSTATE" value="test_viewstate" />'
             '<input name="__EVENTVALIDATION" value="test_eventvalidation" />'
         )
         mock_get_response.raise_for_status = lambda: None
 
-        mock_post_response = MagicMock()
+        mock_post_response = Mock(spec=requests.Response)
         mock_post_response.raise_for_status = lambda: None
         mock_post_response.status_code = 302
         mock_post_response.headers = {"Location": "/mdk/"}
@@ -96,28 +97,43 @@ class TestCookieAuth(unittest.TestCase):
             requests.Session.get = original_get
             requests.Session.post = original_post
 
-    @patch("fogis_api_client.fogis_api_client.FogisApiClient._api_request")
-    def test_validate_cookies_valid(self, mock_api_request):
+    def test_validate_cookies_valid(self):
         """Test validate_cookies method with valid cookies."""
-        mock_api_request.return_value = {"matcher": []}
-
         client = FogisApiClient(cookies=self.test_cookies)
+        mock_api_request = client._api_request = Mock(return_value={"matcher": []})
+
         result = client.validate_cookies()
 
         self.assertTrue(result)
         mock_api_request.assert_called_once()
 
-    @patch("fogis_api_client.fogis_api_client.FogisApiClient._api_request")
-    def test_validate_cookies_invalid(self, mock_api_request):
+    def test_validate_cookies_invalid(self):
         """Test validate_cookies method with invalid cookies."""
-        mock_api_request.side_effect = FogisLoginError("Invalid session")
-
         client = FogisApiClient(cookies=self.test_cookies)
+        mock_api_request = client._api_request = Mock(
+            side_effect=FogisLoginError("Invalid session")
+        )
+
         result = client.validate_cookies()
 
         self.assertFalse(result)
         mock_api_request.assert_called_once()
 
+    @requests_mock.Mocker()
+    def test_validate_cookies_login_page(self, mocker):
+        """Test validate_cookies when the server answers with the HTML login page."""
+        mocker.get(
+            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatcherAttRapportera",
+            text="<html><body>Logga in</body></html>",
+            headers={"Content-Type": "text/html"},
+        )
+        client = FogisApiClient(cookies=self.test_cookies)
+
+        result = client.validate_cookies()
+
+        self.assertFalse(result)
+        self.assertEqual(mocker.call_count, 1)
+
     def test_validate_cookies_no_cookies(self):
         """Test validate_cookies method with no cookies."""
         client = FogisApiClient(username="test_user", password="test_pass")
@@ -1,9 +1,12 @@
+import logging
 import os
 import subprocess
 import unittest
 
 import docker
 
+logger = logging.getLogger(__name__)
+
 
 class TestDockerSetup(unittest.TestCase):
     """Test the Docker setup functionality.
@@ -35,7 +38,7 @@ class TestDockerSetup(unittest.TestCase):
             # Container doesn't exist, which is fine
             pass
         except Exception as e:
-            print(f"Warning: Error removing existing container: {e}")
+            logger.warning("Error removing existing container: %s", e)
 
         # Build the image
         cls.client = client
@@ -60,7 +63,7 @@ class TestDockerSetup(unittest.TestCase):
             # Container doesn't exist, which is fine
             pass
         except Exception as e:
-            print(f"Warning: Error removing container during tearDown: {e}")
+            logger.warning("Error removing container during tearDown: %s", e)
 
     def test_docker_compose_file_exists(self):
         """Test that the Docker Compose files exist."""
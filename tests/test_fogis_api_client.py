@@ -1,581 +1,511 @@
-import io
-import logging
-import unittest
-from unittest.mock import MagicMock, Mock
+"""
+Tests for FogisApiClient.
 
+Expected URLs are spelled out rather than taken from fogis_api_client.endpoints,
+so that a wrong path in the client fails the tests.
+"""
+
+import re
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
 import requests
 
+from fogis_api_client.event_types import EVENT_TYPES
 from fogis_api_client.fogis_api_client import (
     FogisApiClient,
     FogisAPIRequestError,
+    FogisDataError,
     FogisLoginError,
 )
+from tests.helpers import make_response
+
+# Full URL fetch_matches_list_json posts to
+MATCHES_TO_REPORT_URL = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatcherAttRapportera"
+
+# Paths of the page methods checked by assert_api_request, by method name
+ENDPOINTS = {
+    "GetMatchresultatlista": "/MatchWebMetoder.aspx/GetMatchresultatlista",
+    "SparaMatchhandelse": "/MatchWebMetoder.aspx/SparaMatchhandelse",
+    "SparaMatchresultatLista": "/MatchWebMetoder.aspx/SparaMatchresultatLista",
+    "SparaMatchlagledare": "/MatchWebMetoder.aspx/SparaMatchlagledare",
+}
+
+# Placeholder endpoints for the generic _api_request tests
+SOME_ENDPOINT_URL = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/SomeEndpoint"
+GET_SOME_DATA_URL = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetSomeData"
+
+
+class FrozenDatetime(datetime):
+    """datetime whose today() is pinned, so default match-list dates can be compared exactly."""
+
+    @classmethod
+    def today(cls):
+        return cls(2024, 1, 20)
+
+
+# Default match-list filter fetch_matches_list_json sends on FrozenDatetime.today()
+DEFAULT_MATCH_LIST_FILTER = {
+    "datumFran": "2024-01-13",
+    "datumTill": "2025-01-19",
+    "datumTyp": 0,
+    "typ": "alla",
+    "status": ("avbruten", "uppskjuten", "installd"),
+    "alderskategori": (1, 2, 3, 4, 5),
+    "kon": (3, 2, 4),
+    "sparadDatum": "2024-01-20",
+}
+
+# Cookies of the logged-in client built by client_with_mock_session
+AUTH_COOKIES = {"FogisMobilDomarKlient.ASPXAUTH": "mock_auth_cookie"}
+
+# Headers _api_request sends for the logged-in client built by client_with_mock_session
+EXPECTED_HEADERS = {
+    "Content-Type": "application/json; charset=UTF-8",
+    "Accept": "application/json, text/javascript, */*; q=0.01",
+    "Origin": "https://fogis.svenskfotboll.se",
+    "Referer": f"{FogisApiClient.BASE_URL}/",
+    "X-Requested-With": "XMLHttpRequest",
+    "Cookie": "FogisMobilDomarKlient.ASPXAUTH=mock_auth_cookie",
+}
+
+# Login page with the ASP.NET form fields login() scrapes before posting credentials
+LOGIN_PAGE_HTML = (
+    '<input name="__VIEWSTATE" value="viewstate_value" />'
+    '<input name="__EVENTVALIDATION" value="eventvalidation_value" />'
+)
+
+# Responses login() only reads attributes from, so plain namespaces stand in for them
+LOGIN_PAGE_RESPONSE = SimpleNamespace(text=LOGIN_PAGE_HTML, raise_for_status=lambda: None)
+LOGIN_REDIRECT_RESPONSE = SimpleNamespace(raise_for_status=lambda: None)
+
+# Precompiled pattern for the message of FogisAPIRequestError
+API_REQUEST_FAILED = re.compile("API request failed")
+
+# A regular goal event; all numeric fields are already ints, so it must be sent unchanged
+REGULAR_GOAL_EVENT = {
+    "matchhandelseid": 0,
+    "matchid": 123456,
+    "handelsekod": 6,  # Regular goal
+    "matchminut": 35,
+    "minut": 35,
+    "lagid": 78910,
+    "matchlagid": 78910,
+    "personid": 12345,
+    "spelareid": 12345,
+    "assisterandeid": None,
+    "period": 1,
+    "resultatHemma": 1,
+    "resultatBorta": 0,
+    "hemmamal": 1,
+    "bortamal": 0,
+    "sekund": 0,
+    "planpositionx": "-1",
+    "planpositiony": "-1",
+}
+
+
+def assert_api_request(client, name, payload):
+    """Assert the client's stubbed _api_request was called once, for ENDPOINTS[name]."""
+    client._api_request.assert_called_once_with(
+        f"{FogisApiClient.BASE_URL}{ENDPOINTS[name]}", payload
+    )
+
+
+@pytest.fixture(scope="module")
+def client_with_mock_session():
+    """Create one logged-in client with a mocked session, shared by the module."""
+    client = FogisApiClient("testuser", "testpassword")
+
+    # Create a mock session
+    mock_session = Mock(spec_set=requests.Session())
+
+    client.session = mock_session
+
+    return client, mock_session
+
+
+@pytest.fixture(autouse=True)
+def _reset(client_with_mock_session):
+    """Reset the shared client's cookies and mock session before each test."""
+    client, mock_session = client_with_mock_session
+    mock_session.reset_mock(return_value=True, side_effect=True)
+    client.cookies = dict(AUTH_COOKIES)  # Simulate being logged in
+
+
+@pytest.fixture
+def stub_api_request(client_with_mock_session, monkeypatch):
+    """Return a function that replaces the shared client's _api_request for one test."""
+    client, _ = client_with_mock_session
+
+    def stub(**kwargs):
+        mock = Mock(spec_set=client._api_request, **kwargs)
+        monkeypatch.setattr(client, "_api_request", mock)
+        return mock
+
+    return stub
+
+
+@pytest.mark.parametrize(
+    "auth_cookies, raises",
+    [
+        (AUTH_COOKIES, None),
+        ({}, FogisLoginError),
+    ],
+    ids=["success", "invalid_credentials"],
+)
+def test_login(client_with_mock_session, monkeypatch, auth_cookies, raises):
+    """Unit test for login with valid and invalid credentials."""
+    client, mocked_session = client_with_mock_session
+    # Log the shared client out for this test only
+    monkeypatch.setattr(client, "cookies", None)
 
+    # Mock the post response; only a redirect carrying the auth cookie is a successful login
+    mocked_session.post.return_value = SimpleNamespace(
+        status_code=302, headers={"Location": "/mdk/"}, cookies=auth_cookies
+    )
 
-class MockResponse:
-    """
-    A mock class to simulate requests.Response for testing.
-    """
-
-    def __init__(self, json_data, status_code):
-        self._json_data = json_data
-        self.status_code = status_code
-
-    def json(self):
-        if isinstance(self._json_data, Exception):
-            raise self._json_data
-        return self._json_data
-
-    def raise_for_status(self):
-        if 400 <= self.status_code < 600:
-            raise requests.exceptions.HTTPError(
-                f"HTTP Error {self.status_code}", response=self
-            )
-
-
-class TestFogisApiClient(unittest.TestCase):
-    """Test cases for the FogisApiClient class."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.client = FogisApiClient("testuser", "testpassword")
-
-        # Create a mock session
-        mock_session = Mock()
-        mock_session.get = MagicMock()
-        mock_session.post = MagicMock()
-        mock_session.cookies = MagicMock(spec=dict)
-        mock_session.cookies.set = MagicMock()
-
-        self.client.session = mock_session
-        self.client.cookies = {
-            "FogisMobilDomarKlient.ASPXAUTH": "mock_auth_cookie"
-        }  # Simulate being logged in
-
-        # Set up logging capture
-        self.log_capture = io.StringIO()
-        self.log_handler = logging.StreamHandler(self.log_capture)
-        self.logger = logging.getLogger("fogis_api_client.fogis_api_client")
-        self.logger.addHandler(self.log_handler)
-        self.logger.setLevel(logging.INFO)
-
-    def tearDown(self):
-        """Tear down test fixtures."""
-        self.logger.removeHandler(self.log_handler)
-        self.log_handler.close()
-
-    def test_login_success(self):
-        """Unit test for successful login."""
-        # Create a client without cookies
-        client = FogisApiClient("testuser", "testpassword")
-
-        # Mock the session
-        mocked_session = Mock()
-        client.session = mocked_session
-
-        # Mock the get response to return a valid login page
-        mock_get_response = Mock()
-        mock_get_response.text = (
-            '<input name="__VIEWSTATE" value="viewstate_value" />'
-            '<input name="__EVENTVALIDATION" value="eventvalidation_value" />'
-        )
-        mocked_session.get.return_value = mock_get_response
-
-        # Mock the post response for successful login (302 redirect)
-        mock_post_response = Mock()
-        mock_post_response.status_code = 302
-        mock_post_response.headers = {"Location": "/mdk/"}
-        mock_post_response.cookies = {
-            "FogisMobilDomarKlient.ASPXAUTH": "mock_auth_cookie"
-        }
-        mocked_session.post.return_value = mock_post_response
-
-        # Mock the redirect response
-        mock_redirect_response = Mock()
-        mocked_session.get.side_effect = [mock_get_response, mock_redirect_response]
-
-        # Mock the cookies to simulate successful login
-        mocked_session.cookies = {"FogisMobilDomarKlient.ASPXAUTH": "mock_auth_cookie"}
-
-        # Call login
-        cookies = client.login()
+    # Mock the login page and redirect responses
+    mocked_session.get.side_effect = [LOGIN_PAGE_RESPONSE, LOGIN_REDIRECT_RESPONSE]
 
-        # Verify the result
-        self.assertIn("FogisMobilDomarKlient.ASPXAUTH", cookies)
-        self.assertEqual(cookies["FogisMobilDomarKlient.ASPXAUTH"], "mock_auth_cookie")
-        self.assertEqual(
-            mocked_session.get.call_count, 2
-        )  # Initial page load + redirect
-        mocked_session.post.assert_called_once()
-
-    def test_login_failure_invalid_credentials(self):
-        """Unit test for login failure due to invalid credentials."""
-        # Create a client without cookies
-        client = FogisApiClient("testuser", "testpassword")
-
-        # Mock the session
-        mocked_session = Mock()
-        client.session = mocked_session
-
-        # Mock the get response to return a valid login page
-        mock_get_response = Mock()
-        mock_get_response.text = (
-            '<input name="__VIEWSTATE" value="viewstate_value" />'
-            '<input name="__EVENTVALIDATION" value="eventvalidation_value" />'
-        )
-        mocked_session.get.return_value = mock_get_response
-
-        # Mock the post response to simulate failed login for both field name attempts
-        mock_post_response = Mock()
-        mock_post_response.status_code = 200  # Not a redirect
-        # Make both post calls return the same failed response
-        mocked_session.post.return_value = mock_post_response
-
-        # Make post only return one response to simplify the test
-        mocked_session.post = Mock(return_value=mock_post_response)
-
-        # Mock the cookies to simulate failed login (no auth cookie)
-        mocked_session.cookies = {}
-
-        # Call login and expect an exception
-        with self.assertRaises(FogisLoginError):
-            client.login()
+    # Mock the session cookies set by the login
+    monkeypatch.setattr(mocked_session, "cookies", dict(auth_cookies))
 
+    if raises:
+        with pytest.raises(raises):
+            client.login()
         mocked_session.get.assert_called_once()
-        # Verify that the post method was called once
-        mocked_session.post.assert_called_once()
-
-    def test_api_request_success(self):
-        """Unit test for successful _api_request POST."""
-        # Mock the session's post method
-        mock_session_instance = self.client.session
-        url = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/SomeEndpoint"
-        payload = {"param1": "value1"}
-
-        # Create a mock response
-        mock_api_response = MockResponse({"d": '{"key": "value"}'}, 200)
-        mock_session_instance.post.return_value = mock_api_response
-
-        # Call _api_request
-        response_data = self.client._api_request(url, payload, method="POST")
-
-        # Verify the result
-        self.assertEqual(response_data, {"key": "value"})
-        mock_session_instance.post.assert_called_once_with(
-            url,
-            json=payload,
-            headers={
-                "Content-Type": "application/json; charset=UTF-8",
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Origin": "https://fogis.svenskfotboll.se",
-                "Referer": f"{FogisApiClient.BASE_URL}/",
-                "X-Requested-With": "XMLHttpRequest",
-                "Cookie": "FogisMobilDomarKlient.ASPXAUTH=mock_auth_cookie",
-            },
-        )
-
-    def test_api_request_get_success(self):
-        """Unit test for successful _api_request GET."""
-        # Mock the session's get method
-        mock_session_instance = self.client.session
-        url = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetSomeData"
-
-        # Create a mock response
-        mock_api_response = MockResponse({"d": '{"items": [1, 2, 3]}'}, 200)
-        mock_session_instance.get.return_value = mock_api_response
-
-        # Call _api_request
-        response_data = self.client._api_request(url, method="GET")
-
-        # Verify the result
-        self.assertEqual(response_data, {"items": [1, 2, 3]})
-        mock_session_instance.get.assert_called_once_with(
-            url,
-            params=None,
-            headers={
-                "Content-Type": "application/json; charset=UTF-8",
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Origin": "https://fogis.svenskfotboll.se",
-                "Referer": f"{FogisApiClient.BASE_URL}/",
-                "X-Requested-With": "XMLHttpRequest",
-                "Cookie": "FogisMobilDomarKlient.ASPXAUTH=mock_auth_cookie",
-            },
-        )
-
-    def test_api_request_http_error(self):
-        """Unit test for _api_request handling HTTP errors."""
-        # Mock the session's post method
-        mock_session_instance = self.client.session
-        url = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/SomeEndpoint"
-        payload = {"param1": "value1"}
-
-        # Create a mock response that raises an HTTP error
-        mock_api_response = MockResponse({"error": "Not found"}, 404)
-        mock_session_instance.post.return_value = mock_api_response
-        mock_api_response.raise_for_status = MagicMock(
-            side_effect=requests.exceptions.HTTPError("HTTP Error 404")
-        )
-
-        # Call _api_request and expect an exception
-        with self.assertRaises(FogisAPIRequestError) as excinfo:
-            self.client._api_request(url, payload, method="POST")
-
-        self.assertIn("API request failed", str(excinfo.exception))
-        mock_session_instance.post.assert_called_once_with(
-            url,
-            json=payload,
-            headers={
-                "Content-Type": "application/json; charset=UTF-8",
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Origin": "https://fogis.svenskfotboll.se",
-                "Referer": f"{FogisApiClient.BASE_URL}/",
-                "X-Requested-With": "XMLHttpRequest",
-                "Cookie": "FogisMobilDomarKlient.ASPXAUTH=mock_auth_cookie",
-            },
-        )
-
-    def test_api_request_invalid_json_response(self):
-        """Unit test for _api_request handling invalid JSON response (missing 'd')."""
-        # Mock the session's post method
-        mock_session_instance = self.client.session
-        url = f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/SomeEndpoint"
-        payload = {"param1": "value1"}
-
-        # Create a mock response with invalid JSON (no 'd' key)
-        mock_api_response = MockResponse({"not_d": "some_value"}, 200)
-        mock_session_instance.post.return_value = mock_api_response
-
-        # Call _api_request and expect the response to be returned as is
-        response_data = self.client._api_request(url, payload, method="POST")
-
-        # Verify the result
-        self.assertEqual(response_data, {"not_d": "some_value"})
-
-        mock_session_instance.post.assert_called_once_with(
-            url,
-            json=payload,
-            headers={
-                "Content-Type": "application/json; charset=UTF-8",
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Origin": "https://fogis.svenskfotboll.se",
-                "Referer": f"{FogisApiClient.BASE_URL}/",
-                "X-Requested-With": "XMLHttpRequest",
-                "Cookie": "FogisMobilDomarKlient.ASPXAUTH=mock_auth_cookie",
+    else:
+        cookies = client.login()
+        assert cookies["FogisMobilDomarKlient.ASPXAUTH"] == "mock_auth_cookie"
+        assert mocked_session.get.call_count == 2  # Initial page load + redirect
+    mocked_session.post.assert_called_once()
+
+
+def test_clients_share_connection_pool_but_not_cookies():
+    """Clients reuse one HTTP adapter while keeping separate cookie jars."""
+    with FogisApiClient(
+        cookies={"FogisMobilDomarKlient.ASPXAUTH": "cookie_a"}
+    ) as client_a, FogisApiClient(
+        cookies={"FogisMobilDomarKlient.ASPXAUTH": "cookie_b"}
+    ) as client_b:
+        adapter = FogisApiClient._http_adapter
+        assert client_a.session.get_adapter(FogisApiClient.BASE_URL) is adapter
+        assert client_b.session.get_adapter(FogisApiClient.BASE_URL) is adapter
+        assert client_a.session.cookies is not client_b.session.cookies
+        assert client_a.session.cookies.get("FogisMobilDomarKlient.ASPXAUTH") == "cookie_a"
+        assert client_b.session.cookies.get("FogisMobilDomarKlient.ASPXAUTH") == "cookie_b"
+
+
+def test_context_manager_closes_session_but_not_shared_pool(monkeypatch):
+    """Leaving the with block closes the client's session, not the shared adapter."""
+    adapter_close = Mock()
+    monkeypatch.setattr(FogisApiClient._http_adapter, "close", adapter_close)
+
+    with FogisApiClient(cookies={"FogisMobilDomarKlient.ASPXAUTH": "cookie"}) as client:
+        # Wrap the real close so the session is still closed
+        session_close = Mock(wraps=client.session.close)
+        monkeypatch.setattr(client.session, "close", session_close)
+
+    session_close.assert_called_once_with()
+    assert client.session.adapters == {}
+    adapter_close.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "method, url, payload, body, expected, request_kwargs",
+    [
+        (
+            "POST",
+            SOME_ENDPOINT_URL,
+            {"param1": "value1"},
+            {"d": '{"key": "value"}'},
+            {"key": "value"},
+            {"json": {"param1": "value1"}},
+        ),
+        (
+            "GET",
+            GET_SOME_DATA_URL,
+            None,
+            {"d": '{"items": [1, 2, 3]}'},
+            {"items": [1, 2, 3]},
+            {"params": None},
+        ),
+    ],
+    ids=["post", "get"],
+)
+def test_api_request_success(
+    client_with_mock_session, method, url, payload, body, expected, request_kwargs
+):
+    """Unit test for successful _api_request POST and GET."""
+    client, mock_session = client_with_mock_session
+    session_method = getattr(mock_session, method.lower())
+
+    # Create a mock response
+    session_method.return_value = make_response(body, 200)
+
+    # Call _api_request
+    response_data = client._api_request(url, payload, method=method)
+
+    # Verify the result
+    assert response_data == expected
+    session_method.assert_called_once_with(url, headers=EXPECTED_HEADERS, **request_kwargs)
+
+
+def test_api_request_http_error(client_with_mock_session):
+    """Unit test for _api_request handling HTTP errors."""
+    client, mock_session = client_with_mock_session
+    payload = {"param1": "value1"}
+
+    # Create a mock response that raises an HTTP error
+    mock_api_response = make_response({"error": "Not found"}, 404)
+    mock_session.post.return_value = mock_api_response
+
+    # Call _api_request and expect an exception
+    with pytest.raises(FogisAPIRequestError, match=API_REQUEST_FAILED):
+        client._api_request(SOME_ENDPOINT_URL, payload, method="POST")
+
+    mock_session.post.assert_called_once_with(
+        SOME_ENDPOINT_URL,
+        json=payload,
+        headers=EXPECTED_HEADERS,
+    )
+
+
+@pytest.mark.parametrize(
+    "body, expected_error",
+    [
+        (b'{"not_d": "some_value"}', None),
+        (b"<html>Server Error</html>", FogisDataError),
+    ],
+    ids=["missing_d_key", "body_not_json"],
+)
+def test_api_request_invalid_json_response(client_with_mock_session, body, expected_error):
+    """Unit test for _api_request handling responses without a valid 'd' envelope."""
+    client, mock_session = client_with_mock_session
+    payload = {"param1": "value1"}
+
+    # Create a mock response with the raw body
+    mock_api_response = make_response(None, 200)
+    mock_api_response.content = body
+    mock_session.post.return_value = mock_api_response
+
+    if expected_error:
+        # A body that is not JSON at all is a data error, not a request error
+        with pytest.raises(expected_error, match="Failed to parse API response"):
+            client._api_request(SOME_ENDPOINT_URL, payload, method="POST")
+    else:
+        # Valid JSON without a 'd' key is returned as is
+        response_data = client._api_request(SOME_ENDPOINT_URL, payload, method="POST")
+        assert response_data == {"not_d": "some_value"}
+
+    mock_session.post.assert_called_once_with(
+        SOME_ENDPOINT_URL,
+        json=payload,
+        headers=EXPECTED_HEADERS,
+    )
+
+
+def test_api_request_headers_follow_cookie_changes(client_with_mock_session):
+    """The Cookie header is built from the client's cookies at the time of each request."""
+    client, mock_session = client_with_mock_session
+    mock_session.post.return_value = make_response({"d": "{}"}, 200)
+
+    client._api_request(SOME_ENDPOINT_URL, {})
+    assert mock_session.post.call_args.kwargs["headers"] == EXPECTED_HEADERS
+
+    # _reset restores the logged-in cookies for the next test
+    client.cookies = {"FogisMobilDomarKlient.ASPXAUTH": "new_auth_cookie"}
+    client._api_request(SOME_ENDPOINT_URL, {})
+    new_headers = mock_session.post.call_args.kwargs["headers"]
+    assert new_headers["Cookie"] == "FogisMobilDomarKlient.ASPXAUTH=new_auth_cookie"
+
+
+@pytest.mark.parametrize(
+    "filter_arg, matchlista",
+    [
+        (None, [{"matchid": 1}, {"matchid": 2}]),
+        (None, []),
+        (
+            {
+                "datumFran": "2023-01-01",
+                "datumTill": "2023-01-31",
+                "datumTyp": "match",
+                "sparadDatum": "2023-01-15",
             },
-        )
-
-    def test_fetch_matches_list_json_success(self):
-        """Unit test for fetch_matches_list_json success."""
-        # Mock the _api_request method
-        self.client._api_request = MagicMock(
-            return_value={"matchlista": [{"matchid": 1}, {"matchid": 2}]}
-        )
-
-        # Call fetch_matches_list_json
-        matches_list = self.client.fetch_matches_list_json()
-
-        # Verify the result
-        self.assertEqual(matches_list, [{"matchid": 1}, {"matchid": 2}])
-
-        # Verify the API call was made once with the correct endpoint
-        self.assertEqual(self.client._api_request.call_count, 1)
-        call_args = self.client._api_request.call_args[0]
-        self.assertEqual(
-            call_args[0],
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatcherAttRapportera",
-        )
-
-        # Verify the filter structure without checking exact date values
-        filter_data = call_args[1]["filter"]
-        self.assertIn("datumFran", filter_data)
-        self.assertIn("datumTill", filter_data)
-        self.assertEqual(filter_data["datumTyp"], 0)
-        self.assertEqual(filter_data["typ"], "alla")
-        self.assertEqual(filter_data["status"], ["avbruten", "uppskjuten", "installd"])
-        self.assertEqual(filter_data["alderskategori"], [1, 2, 3, 4, 5])
-        self.assertEqual(filter_data["kon"], [3, 2, 4])
-        self.assertIn("sparadDatum", filter_data)
-
-    def test_fetch_matches_list_json_call_args(self):
-        """Unit test for fetch_matches_list_json argument verification."""
-        # Mock the _api_request method
-        self.client._api_request = MagicMock(return_value={"matchlista": []})
-
-        # Call fetch_matches_list_json
-        self.client.fetch_matches_list_json()
-
-        # Verify the API call was made once with the correct endpoint
-        self.assertEqual(self.client._api_request.call_count, 1)
-        call_args = self.client._api_request.call_args[0]
-        self.assertEqual(
-            call_args[0],
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatcherAttRapportera",
-        )
-
-        # Verify the filter structure without checking exact date values
-        filter_data = call_args[1]["filter"]
-        self.assertIn("datumFran", filter_data)
-        self.assertIn("datumTill", filter_data)
-        self.assertEqual(filter_data["datumTyp"], 0)
-        self.assertEqual(filter_data["typ"], "alla")
-        self.assertEqual(filter_data["status"], ["avbruten", "uppskjuten", "installd"])
-        self.assertEqual(filter_data["alderskategori"], [1, 2, 3, 4, 5])
-        self.assertEqual(filter_data["kon"], [3, 2, 4])
-        self.assertIn("sparadDatum", filter_data)
-
-    def test_fetch_matches_list_json_api_call_only(self):
-        """Unit test for fetch_matches_list_json verifying API call (no filtering)."""
-        # Mock the _api_request method
-        self.client._api_request = MagicMock(return_value={"matchlista": []})
-
-        # Call fetch_matches_list_json WITHOUT filter argument
-        self.client.fetch_matches_list_json()
-
-        # Verify the API call was made once with the correct endpoint
-        self.assertEqual(self.client._api_request.call_count, 1)
-        call_args = self.client._api_request.call_args[0]
-        self.assertEqual(
-            call_args[0],
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatcherAttRapportera",
-        )
-
-        # Verify the filter structure without checking exact date values
-        filter_data = call_args[1]["filter"]
-        self.assertIn("datumFran", filter_data)
-        self.assertIn("datumTill", filter_data)
-        self.assertEqual(filter_data["datumTyp"], 0)
-        self.assertEqual(filter_data["typ"], "alla")
-        self.assertEqual(filter_data["status"], ["avbruten", "uppskjuten", "installd"])
-        self.assertEqual(filter_data["alderskategori"], [1, 2, 3, 4, 5])
-        self.assertEqual(filter_data["kon"], [3, 2, 4])
-        self.assertIn("sparadDatum", filter_data)
-
-    def test_fetch_matches_list_json_server_date_filter_call_args(self):
-        """Test fetch_matches_list_json with server-side date filter arguments."""
-        # Mock the _api_request method
-        self.client._api_request = MagicMock(return_value={"matchlista": []})
-
-        # Call fetch_matches_list_json with filter
-        custom_filter = {
-            "datumFran": "2023-01-01",
-            "datumTill": "2023-01-31",
-            "datumTyp": "match",
-            "sparadDatum": "2023-01-15",
-        }
-        self.client.fetch_matches_list_json(filter=custom_filter)
-
-        # Verify the API call was made once with the correct endpoint
-        self.assertEqual(self.client._api_request.call_count, 1)
-        call_args = self.client._api_request.call_args[0]
-        self.assertEqual(
-            call_args[0],
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatcherAttRapportera",
-        )
-
-        # Verify the filter structure with our custom values
-        filter_data = call_args[1]["filter"]
-        self.assertEqual(filter_data["datumFran"], "2023-01-01")
-        self.assertEqual(filter_data["datumTill"], "2023-01-31")
-        self.assertEqual(filter_data["datumTyp"], "match")
-        self.assertEqual(filter_data["sparadDatum"], "2023-01-15")
-
-        # Verify the default values are still present
-        self.assertEqual(filter_data["typ"], "alla")
-        self.assertEqual(filter_data["status"], ["avbruten", "uppskjuten", "installd"])
-        self.assertEqual(filter_data["alderskategori"], [1, 2, 3, 4, 5])
-        self.assertEqual(filter_data["kon"], [3, 2, 4])
-
-    def test_fetch_match_result_json(self):
-        """Unit test for fetch_match_result_json method."""
-        # Mock the _api_request method
-        self.client._api_request = MagicMock(
-            return_value=[
-                {"matchresultattypid": 1, "matchlag1mal": 2, "matchlag2mal": 1}
-            ]
-        )
-
-        # Call fetch_match_result_json
-        match_id = 12345
-        result_data = self.client.fetch_match_result_json(match_id)
-
-        # Verify the result
-        self.assertIsInstance(result_data, list)
-        self.assertEqual(len(result_data), 1)
-        self.assertEqual(result_data[0]["matchlag1mal"], 2)
-        self.assertEqual(result_data[0]["matchlag2mal"], 1)
-
-        # Verify the API call
-        self.client._api_request.assert_called_once_with(
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatchresultatlista",
-            {"matchid": 12345},
-        )
-
-    def test_fetch_match_result_json_error(self):
-        """Unit test for fetch_match_result_json method with error."""
-        # Mock the _api_request method to raise an exception
-        error_msg = "API request failed"
-        self.client._api_request = MagicMock(
-            side_effect=FogisAPIRequestError(error_msg)
-        )
-
-        # Call fetch_match_result_json and expect an exception
-        with self.assertRaises(FogisAPIRequestError) as excinfo:
-            self.client.fetch_match_result_json(12345)
-
-        # Verify the exception message
-        self.assertIn("API request failed", str(excinfo.exception))
-
-        # Verify the API call
-        self.client._api_request.assert_called_once_with(
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/GetMatchresultatlista",
-            {"matchid": 12345},
-        )
-
-    def test_report_match_result(self):
-        """Unit test for report_match_result method."""
-        # Mock the _api_request method
-        self.client._api_request = MagicMock(return_value={"success": True})
-
-        # Call report_match_result
-        result_data = {
-            "matchid": "12345",
+            [],
+        ),
+    ],
+    ids=["success", "no_matches", "server_date_filter"],
+)
+def test_fetch_matches_list_json(
+    client_with_mock_session, stub_api_request, monkeypatch, filter_arg, matchlista
+):
+    """Unit test for the fetch_matches_list_json request filter and result."""
+    client, mock_session = client_with_mock_session
+    monkeypatch.setattr("fogis_api_client.fogis_api_client.datetime", FrozenDatetime)
+    # Mock the _api_request method
+    stub_api_request(return_value={"matchlista": matchlista})
+
+    # Call fetch_matches_list_json, with the custom filter if there is one
+    if filter_arg is None:
+        matches_list = client.fetch_matches_list_json()
+    else:
+        matches_list = client.fetch_matches_list_json(filter=filter_arg)
+
+    # Verify the result
+    assert matches_list == matchlista
+
+    # Verify the one API call and its whole filter: the defaults for the frozen day,
+    # overridden by any custom values
+    client._api_request.assert_called_once_with(
+        MATCHES_TO_REPORT_URL,
+        {"filter": {**DEFAULT_MATCH_LIST_FILTER, **(filter_arg or {})}},
+    )
+
+
+def test_fetch_match_result_json(client_with_mock_session, stub_api_request):
+    """Unit test for fetch_match_result_json method."""
+    client, mock_session = client_with_mock_session
+    # Mock the _api_request method
+    stub_api_request(
+        return_value=[{"matchresultattypid": 1, "matchlag1mal": 2, "matchlag2mal": 1}]
+    )
+
+    # Call fetch_match_result_json
+    match_id = 12345
+    result_data = client.fetch_match_result_json(match_id)
+
+    # Verify the result
+    assert result_data == [
+        {"matchresultattypid": 1, "matchlag1mal": 2, "matchlag2mal": 1}
+    ]
+
+    # Verify the API call
+    assert_api_request(client, "GetMatchresultatlista", {"matchid": 12345})
+
+
+def test_fetch_match_result_json_error(client_with_mock_session, stub_api_request):
+    """Unit test for fetch_match_result_json method with error."""
+    client, mock_session = client_with_mock_session
+    # Mock the _api_request method to raise an exception
+    stub_api_request(side_effect=FogisAPIRequestError("API request failed"))
+
+    # Call fetch_match_result_json and expect an exception
+    with pytest.raises(FogisAPIRequestError, match=API_REQUEST_FAILED):
+        client.fetch_match_result_json(12345)
+
+    # Verify the API call
+    assert_api_request(client, "GetMatchresultatlista", {"matchid": 12345})
+
+
+def test_report_regular_goal_event_payload(client_with_mock_session, stub_api_request):
+    """Unit test for the payload sent by report_match_event for a regular goal."""
+    client, mock_session = client_with_mock_session
+    # Mock the _api_request method
+    stub_api_request(return_value={"success": True})
+
+    # Send a copy so the constant cannot be changed by the client
+    response = client.report_match_event(dict(REGULAR_GOAL_EVENT))
+
+    # Verify the result
+    assert response == {"success": True}
+
+    # Verify the API call
+    assert_api_request(client, "SparaMatchhandelse", REGULAR_GOAL_EVENT)
+
+
+@pytest.mark.parametrize("raises", [None, FogisAPIRequestError], ids=["success", "error"])
+def test_report_match_result(client_with_mock_session, stub_api_request, raises):
+    """Unit test for report_match_result when the API call succeeds or fails."""
+    client, mock_session = client_with_mock_session
+    # Mock the _api_request method to return a response or raise an exception
+    if raises:
+        stub_api_request(side_effect=FogisAPIRequestError("API request failed"))
+    else:
+        stub_api_request(return_value={"success": True})
+
+    # Call report_match_result
+    result_data = {
+        "matchid": "12345",
+        "hemmamal": 2,
+        "bortamal": 1,
+        "halvtidHemmamal": 1,
+        "halvtidBortamal": 0,
+    }
+    if raises:
+        with pytest.raises(raises, match=API_REQUEST_FAILED):
+            client.report_match_result(result_data)
+    else:
+        assert client.report_match_result(result_data) == {"success": True}
+
+    # Verify the API call
+    assert_api_request(
+        client,
+        "SparaMatchresultatLista",
+        {
+            "matchid": 12345,  # Should be converted to int
             "hemmamal": 2,
             "bortamal": 1,
             "halvtidHemmamal": 1,
             "halvtidBortamal": 0,
-        }
-        response = self.client.report_match_result(result_data)
-
-        # Verify the result
-        self.assertEqual(response, {"success": True})
-
-        # Verify the API call
-        self.client._api_request.assert_called_once_with(
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/SparaMatchresultatLista",
-            {
-                "matchid": 12345,  # Should be converted to int
-                "hemmamal": 2,
-                "bortamal": 1,
-                "halvtidHemmamal": 1,
-                "halvtidBortamal": 0,
-            },
-        )
-
-    def test_report_match_result_error(self):
-        """Unit test for report_match_result method with error."""
-        # Mock the _api_request method to raise an exception
-        error_msg = "API request failed"
-        self.client._api_request = MagicMock(
-            side_effect=FogisAPIRequestError(error_msg)
-        )
-
-        # Call report_match_result and expect an exception
-        result_data = {"matchid": "12345", "hemmamal": 2, "bortamal": 1}
-        with self.assertRaises(FogisAPIRequestError) as excinfo:
-            self.client.report_match_result(result_data)
-
-        # Verify the exception message
-        self.assertIn("API request failed", str(excinfo.exception))
-
-        # Verify the API call
-        self.client._api_request.assert_called_once_with(
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/SparaMatchresultatLista",
-            {
-                "matchid": 12345,
-                "hemmamal": 2,
-                "bortamal": 1,
-            },  # Should be converted to int
-        )
-
-    def test_event_types_dictionary(self):
-        """Test that the event_types dictionary is present and properly formatted."""
-        from fogis_api_client.event_types import EVENT_TYPES
-
-        # Check that EVENT_TYPES is a dictionary
-        self.assertIsInstance(EVENT_TYPES, dict)
-
-        # Check that it has the expected keys and structure
-        self.assertIn(6, EVENT_TYPES)  # Regular Goal
-        self.assertIn(20, EVENT_TYPES)  # Yellow Card
-        self.assertIn(17, EVENT_TYPES)  # Substitution
-
-        # Check the structure of an entry
-        self.assertIn("name", EVENT_TYPES[6])
-        self.assertIn("goal", EVENT_TYPES[6])
-        self.assertEqual(EVENT_TYPES[6]["name"], "Regular Goal")
-        self.assertTrue(EVENT_TYPES[6]["goal"])
-
-        # Check a non-goal event
-        self.assertFalse(EVENT_TYPES[20]["goal"])
-
-        # Check a control event
-        self.assertIn("control_event", EVENT_TYPES[31])
-        self.assertTrue(EVENT_TYPES[31]["control_event"])
-
-    def test_report_team_official_action(self):
-        """Unit test for report_team_official_action method."""
-        # Mock the _api_request method
-        self.client._api_request = MagicMock(return_value={"success": True})
-
-        # Call report_team_official_action
-        action_data = {
-            "matchid": "12345",
-            "lagid": "67890",  # Note: This parameter name is still 'lagid' in this method
-            "personid": "54321",
-            "matchlagledaretypid": "2",  # Example: Yellow card
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "event_id, name, is_goal, is_control_event",
+    [
+        (6, "Regular Goal", True, False),
+        (20, "Yellow Card", False, False),
+        (17, "Substitution", False, False),
+        (31, "Period Start", False, True),
+    ],
+)
+def test_event_types_dictionary(event_id, name, is_goal, is_control_event):
+    """Test that the event_types dictionary contains properly formatted entries."""
+    event_type = EVENT_TYPES[event_id]
+    assert event_type["name"] == name
+    assert event_type["goal"] is is_goal
+    assert event_type.get("control_event", False) is is_control_event
+
+
+@pytest.mark.parametrize("raises", [None, FogisAPIRequestError], ids=["success", "error"])
+def test_report_team_official_action(client_with_mock_session, stub_api_request, raises):
+    """Unit test for report_team_official_action when the API call succeeds or fails."""
+    client, mock_session = client_with_mock_session
+    # Mock the _api_request method to return a response or raise an exception
+    if raises:
+        stub_api_request(side_effect=FogisAPIRequestError("API request failed"))
+    else:
+        stub_api_request(return_value={"success": True})
+
+    # Call report_team_official_action
+    action_data = {
+        "matchid": "12345",
+        "lagid": "67890",  # Note: This parameter name is still 'lagid' in this method
+        "personid": "54321",
+        "matchlagledaretypid": "2",  # Example: Yellow card
+        "minut": 65,
+    }
+    if raises:
+        with pytest.raises(raises, match=API_REQUEST_FAILED):
+            client.report_team_official_action(action_data)
+    else:
+        assert client.report_team_official_action(action_data) == {"success": True}
+
+    # Verify the API call
+    assert_api_request(
+        client,
+        "SparaMatchlagledare",
+        {
+            "matchid": 12345,  # Should be converted to int
+            # Note: This parameter name is still 'lagid' in this method
+            "lagid": 67890,  # Should be converted to int
+            "personid": 54321,  # Should be converted to int
+            "matchlagledaretypid": 2,  # Should be converted to int
             "minut": 65,
-        }
-        response = self.client.report_team_official_action(action_data)
-
-        # Verify the result
-        self.assertEqual(response, {"success": True})
-
-        # Verify the API call
-        self.client._api_request.assert_called_once_with(
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/SparaMatchlagledare",
-            {
-                "matchid": 12345,  # Should be converted to int
-                # Note: This parameter name is still 'lagid' in this method
-                "lagid": 67890,  # Should be converted to int
-                "personid": 54321,  # Should be converted to int
-                "matchlagledaretypid": 2,  # Should be converted to int
-                "minut": 65,
-            },
-        )
-
-    def test_report_team_official_action_error(self):
-        """Unit test for report_team_official_action method with error."""
-        # Mock the _api_request method to raise an exception
-        error_msg = "API request failed"
-        self.client._api_request = MagicMock(
-            side_effect=FogisAPIRequestError(error_msg)
-        )
-
-        # Call report_team_official_action and expect an exception
-        action_data = {
-            "matchid": "12345",
-            "lagid": "67890",  # Note: This parameter name is still 'lagid' in this method
-            "personid": "54321",
-            "matchlagledaretypid": "2",
-        }
-        with self.assertRaises(FogisAPIRequestError) as excinfo:
-            self.client.report_team_official_action(action_data)
-
-        # Verify the exception message
-        self.assertIn("API request failed", str(excinfo.exception))
-
-        # Verify the API call
-        self.client._api_request.assert_called_once_with(
-            f"{FogisApiClient.BASE_URL}/MatchWebMetoder.aspx/SparaMatchlagledare",
-            {
-                "matchid": 12345,  # Should be converted to int
-                # Note: This parameter name is still 'lagid' in this method
-                "lagid": 67890,  # Should be converted to int
-                "personid": 54321,  # Should be converted to int
-                "matchlagledaretypid": 2,  # Should be converted to int
-            },
-        )
-
-
-if __name__ == "__main__":
-    unittest.main()
+        },
+    )
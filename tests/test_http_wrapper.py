@@ -15,9 +15,10 @@ class TestHttpWrapper(unittest.TestCase):
         self.app.config["TESTING"] = True
         self.client = self.app.test_client()
 
-        # Mock the FogisApiClient
-        self.mock_fogis_client = Mock()
-        fogis_api_client_http_wrapper.client = self.mock_fogis_client
+        # Mock the FogisApiClient once per test; the patcher restores the real one
+        client_patcher = patch.object(fogis_api_client_http_wrapper, "client", Mock())
+        self.mock_fogis_client = client_patcher.start()
+        self.addCleanup(client_patcher.stop)
 
         # Set up mock responses
         self.mock_fogis_client.hello_world.return_value = "Hello, brave new world!"
@@ -64,9 +65,10 @@ class TestHttpWrapper(unittest.TestCase):
         self.assertIsInstance(response.json, dict)
         self.assertEqual(response.json, {"status": "ok", "message": "FOGIS API Gateway"})
 
-    @patch("fogis_api_client_http_wrapper.client.fetch_matches_list_json")
-    def test_matches_endpoint(self, mock_fetch):
+    def test_matches_endpoint(self):
         """Test the /matches endpoint."""
+        mock_fetch = self.mock_fogis_client.fetch_matches_list_json
+
         # Set up the mock
         mock_fetch.return_value = [{"id": "1", "home_team": "Team A", "away_team": "Team B"}]
 
@@ -78,9 +80,10 @@ class TestHttpWrapper(unittest.TestCase):
         self.assertEqual(response.json, [{"id": "1", "home_team": "Team A", "away_team": "Team B"}])
         mock_fetch.assert_called_once()
 
-    @patch("fogis_api_client_http_wrapper.client.fetch_matches_list_json")
-    def test_matches_endpoint_with_query_params(self, mock_fetch):
+    def test_matches_endpoint_with_query_params(self):
         """Test the /matches endpoint with query parameters."""
+        mock_fetch = self.mock_fogis_client.fetch_matches_list_json
+
         # Set up the mock
         mock_fetch.return_value = [
             {"id": "1", "home_team": "Team A", "away_team": "Team B", "datum": "2023-01-01"}
@@ -107,9 +110,10 @@ class TestHttpWrapper(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         mock_fetch.assert_called_with(filter={})
 
-    @patch("fogis_api_client_http_wrapper.client.fetch_match_json")
-    def test_match_details_endpoint(self, mock_fetch):
+    def test_match_details_endpoint(self):
         """Test the /match/<match_id> endpoint."""
+        mock_fetch = self.mock_fogis_client.fetch_match_json
+
         # Set up the mock
         mock_fetch.return_value = {
             "id": "123",
@@ -134,13 +138,12 @@ class TestHttpWrapper(unittest.TestCase):
         )
         mock_fetch.assert_called_once_with("123")
 
-    @patch("fogis_api_client_http_wrapper.client.fetch_match_json")
-    @patch("fogis_api_client_http_wrapper.client.fetch_match_players_json")
-    @patch("fogis_api_client_http_wrapper.client.fetch_match_officials_json")
-    def test_match_details_endpoint_with_query_params(
-        self, mock_officials, mock_players, mock_match
-    ):
+    def test_match_details_endpoint_with_query_params(self):
         """Test the /match/<match_id> endpoint with query parameters."""
+        mock_match = self.mock_fogis_client.fetch_match_json
+        mock_players = self.mock_fogis_client.fetch_match_players_json
+        mock_officials = self.mock_fogis_client.fetch_match_officials_json
+
         # Set up the mocks
         mock_match.return_value = {
             "id": "123",
@@ -181,9 +184,10 @@ class TestHttpWrapper(unittest.TestCase):
         mock_match.assert_called_with("123")
         mock_officials.assert_called_with("123")
 
-    @patch("fogis_api_client_http_wrapper.client.fetch_match_json")
-    def test_match_details_endpoint_error(self, mock_fetch):
+    def test_match_details_endpoint_error(self):
         """Test the /match/<match_id> endpoint with an error."""
+        mock_fetch = self.mock_fogis_client.fetch_match_json
+
         # Set up the mock to raise an exception
         mock_fetch.side_effect = Exception("Test error")
 
@@ -195,9 +199,10 @@ class TestHttpWrapper(unittest.TestCase):
         self.assertEqual(response.json, {"error": "Test error"})
         mock_fetch.assert_called_once_with("123")
 
-    @patch("fogis_api_client_http_wrapper.client.fetch_matches_list_json")
-    def test_matches_endpoint_error(self, mock_fetch):
+    def test_matches_endpoint_error(self):
         """Test the /matches endpoint with an error."""
+        mock_fetch = self.mock_fogis_client.fetch_matches_list_json
+
         # Set up the mock to raise an exception
         mock_fetch.side_effect = Exception("Test error")
 
@@ -220,9 +225,10 @@ class TestHttpWrapper(unittest.TestCase):
         # We can't easily test the actual signal handling without complex mocking
         self.assertTrue(callable(fogis_api_client_http_wrapper.signal_handler))
 
-    @patch("fogis_api_client_http_wrapper.client.fetch_match_result_json")
-    def test_match_result_endpoint(self, mock_fetch):
+    def test_match_result_endpoint(self):
         """Test the /match/<match_id>/result endpoint."""
+        mock_fetch = self.mock_fogis_client.fetch_match_result_json
+
         # Set up the mock
         mock_fetch.return_value = {"id": "123", "home_score": 2, "away_score": 1}
 
@@ -234,9 +240,10 @@ class TestHttpWrapper(unittest.TestCase):
         self.assertEqual(response.json, {"id": "123", "home_score": 2, "away_score": 1})
         mock_fetch.assert_called_once_with("123")
 
-    @patch("fogis_api_client_http_wrapper.client.fetch_match_events_json")
-    def test_match_events_endpoint(self, mock_fetch):
+    def test_match_events_endpoint(self):
         """Test the /match/<match_id>/events GET endpoint."""
+        mock_fetch = self.mock_fogis_client.fetch_match_events_json
+
         # Set up the mock
         mock_fetch.return_value = [
             {"id": "1", "type": "goal", "player": "John Doe", "team": "Team A", "time": "45:00"}
@@ -253,9 +260,10 @@ class TestHttpWrapper(unittest.TestCase):
         )
         mock_fetch.assert_called_once_with("123")
 
-    @patch("fogis_api_client_http_wrapper.client.fetch_match_events_json")
-    def test_match_events_endpoint_with_query_params(self, mock_fetch):
+    def test_match_events_endpoint_with_query_params(self):
         """Test the /match/<match_id>/events GET endpoint with query parameters."""
+        mock_fetch = self.mock_fogis_client.fetch_match_events_json
+
         # Set up the mock
         mock_fetch.return_value = [
             {"id": "1", "type": "goal", "player": "John Doe", "team": "Team A", "time": "45:00"},
@@ -317,9 +325,10 @@ class TestHttpWrapper(unittest.TestCase):
         self.assertEqual(response.json[0]["time"], "75:00")
         mock_fetch.assert_called_with("123")
 
-    @patch("fogis_api_client_http_wrapper.client.report_match_event")
-    def test_report_match_event_endpoint(self, mock_report):
+    def test_report_match_event_endpoint(self):
         """Test the /match/<match_id>/events POST endpoint."""
+        mock_report = self.mock_fogis_client.report_match_event
+
         # Set up the mock
         mock_report.return_value = {"status": "success"}
 
@@ -344,9 +353,10 @@ class TestHttpWrapper(unittest.TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.json, {"error": "No event data provided"})
 
-    @patch("fogis_api_client_http_wrapper.client.clear_match_events")
-    def test_clear_match_events_endpoint(self, mock_clear):
+    def test_clear_match_events_endpoint(self):
         """Test the /match/<match_id>/events/clear endpoint."""
+        mock_clear = self.mock_fogis_client.clear_match_events
+
         # Set up the mock
         mock_clear.return_value = {"status": "success"}
 
@@ -358,9 +368,10 @@ class TestHttpWrapper(unittest.TestCase):
         self.assertEqual(response.json, {"status": "success"})
         mock_clear.assert_called_once_with("123")
 
-    @patch("fogis_api_client_http_wrapper.client.fetch_match_officials_json")
-    def test_match_officials_endpoint(self, mock_fetch):
+    def test_match_officials_endpoint(self):
         """Test the /match/<match_id>/officials endpoint."""
+        mock_fetch = self.mock_fogis_client.fetch_match_officials_json
+
         # Set up the mock
         mock_fetch.return_value = [{"id": "1", "name": "Jane Smith", "role": "Referee"}]
 
@@ -372,9 +383,10 @@ class TestHttpWrapper(unittest.TestCase):
         self.assertEqual(response.json, [{"id": "1", "name": "Jane Smith", "role": "Referee"}])
         mock_fetch.assert_called_once_with("123")
 
-    @patch("fogis_api_client_http_wrapper.client.fetch_team_players_json")
-    def test_team_players_endpoint(self, mock_fetch):
+    def test_team_players_endpoint(self):
         """Test the /team/<team_id>/players endpoint."""
+        mock_fetch = self.mock_fogis_client.fetch_team_players_json
+
         # Set up the mock
         mock_fetch.return_value = [{"id": "1", "name": "John Doe", "position": "Forward"}]
 
@@ -386,9 +398,10 @@ class TestHttpWrapper(unittest.TestCase):
         self.assertEqual(response.json, [{"id": "1", "name": "John Doe", "position": "Forward"}])
         mock_fetch.assert_called_once_with("456")
 
-    @patch("fogis_api_client_http_wrapper.client.fetch_team_officials_json")
-    def test_team_officials_endpoint(self, mock_fetch):
+    def test_team_officials_endpoint(self):
         """Test the /team/<team_id>/officials endpoint."""
+        mock_fetch = self.mock_fogis_client.fetch_team_officials_json
+
         # Set up the mock
         mock_fetch.return_value = [{"id": "1", "name": "Coach Smith", "role": "Coach"}]
 
@@ -400,9 +413,10 @@ class TestHttpWrapper(unittest.TestCase):
         self.assertEqual(response.json, [{"id": "1", "name": "Coach Smith", "role": "Coach"}])
         mock_fetch.assert_called_once_with("456")
 
-    @patch("fogis_api_client_http_wrapper.client.mark_reporting_finished")
-    def test_finish_match_report_endpoint(self, mock_finish):
+    def test_finish_match_report_endpoint(self):
         """Test the /match/<match_id>/finish endpoint."""
+        mock_finish = self.mock_fogis_client.mark_reporting_finished
+
         # Set up the mock
         mock_finish.return_value = {"success": True}
 
@@ -1,45 +1,25 @@
 import unittest
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
 
 import requests
 
 from fogis_api_client.fogis_api_client import FogisApiClient, FogisAPIRequestError
-
-
-class MockResponse:
-    """
-    A mock class to simulate requests.Response for testing.
-    """
-
-    def __init__(self, json_data, status_code):
-        self._json_data = MagicMock(return_value=json_data)
-        self.status_code = status_code
-
-    def json(self):
-        returned_json_data = self._json_data()
-        return returned_json_data
-
-    def raise_for_status(self):
-        if 400 <= self.status_code < 600:
-            raise requests.exceptions.HTTPError(
-                f"Mocked HTTP Error: {self.status_code}", response=None
-            )
+from tests.helpers import make_response
 
 
 class TestMarkReportingFinished(unittest.TestCase):
     """Test cases for the mark_reporting_finished functionality."""
 
-    def setUp(self):
-        self.client = FogisApiClient("testuser", "testpassword")
+    @classmethod
+    def setUpClass(cls):
+        # Build the client and mock session once; setUp resets them between tests
+        cls.client = FogisApiClient("testuser", "testpassword")
 
-        # Create a mock session
-        mock_session = Mock()
-        mock_session.get = MagicMock()
-        mock_session.post = MagicMock()
-        mock_session.cookies = MagicMock(spec=dict)
-        mock_session.cookies.set = MagicMock()
+        # Create a mock session; its children are only built when a test touches them
+        cls.client.session = Mock(spec_set=requests.Session())
 
-        self.client.session = mock_session
+    def setUp(self):
+        self.client.session.reset_mock(return_value=True, side_effect=True)
         self.client.cookies = {
             "FogisMobilDomarKlient.ASPXAUTH": "mock_auth_cookie"
         }  # Simulate being logged in
@@ -47,7 +27,7 @@ class TestMarkReportingFinished(unittest.TestCase):
     def test_mark_reporting_finished_success(self):
         """Test that mark_reporting_finished works correctly with a valid match ID."""
         # Mock the API response
-        mock_api_response = MockResponse(json_data={"d": {"success": True}}, status_code=200)
+        mock_api_response = make_response({"d": {"success": True}}, 200)
         self.client.session.post.return_value = mock_api_response
 
         # Call mark_reporting_finished
@@ -69,24 +49,17 @@ class TestMarkReportingFinished(unittest.TestCase):
     def test_mark_reporting_finished_empty_match_id(self):
         """Test that mark_reporting_finished raises ValueError with an empty match ID."""
         # Call mark_reporting_finished with an empty match ID
-        with self.assertRaises(ValueError) as context:
+        with self.assertRaisesRegex(ValueError, "match_id cannot be empty"):
             self.client.mark_reporting_finished("")
 
-        self.assertIn("match_id cannot be empty", str(context.exception))
-
         # Verify the API request was not made
         self.client.session.post.assert_not_called()
 
     def test_mark_reporting_finished_api_error(self):
         """Test that mark_reporting_finished handles API errors correctly."""
         # Mock the API response to simulate an error
-        mock_api_response = MockResponse(
-            json_data={"d": {"error": "Some API error"}}, status_code=400
-        )
+        mock_api_response = make_response({"d": {"error": "Some API error"}}, 400)
         self.client.session.post.return_value = mock_api_response
-        mock_api_response.raise_for_status = MagicMock(
-            side_effect=requests.exceptions.HTTPError("Mocked HTTP Error: 400")
-        )
 
         # Call mark_reporting_finished
         match_id = "123456"
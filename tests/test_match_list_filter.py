@@ -1,13 +1,20 @@
+import functools
 import unittest
-from typing import Any, Dict, List
+from itertools import cycle
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
 
 from fogis_api_client.enums import AgeCategory, FootballType, Gender, MatchStatus
 from fogis_api_client.match_list_filter import MatchListFilter
 
 
 # --- Synthetic Data Generation (Adapt to your actual data structure and Enum values) ---
-def create_test_matches(num_matches=10) -> List[Dict[str, Any]]:
-    """Generates a list of synthetic match dictionaries for testing MatchListFilter."""
+@functools.lru_cache(maxsize=None)
+def create_test_matches(num_matches=10) -> Tuple[Mapping[str, Any], ...]:
+    """Generates synthetic match dictionaries for testing MatchListFilter.
+
+    The output is deterministic, so it is cached per num_matches and returned frozen.
+    """
     statuses = [
         MatchStatus.CANCELLED,
         MatchStatus.POSTPONED,
@@ -25,25 +32,39 @@ def create_test_matches(num_matches=10) -> List[Dict[str, Any]]:
     genders = [Gender.MALE, Gender.FEMALE, Gender.MIXED]
     football_types = [FootballType.FOOTBALL, FootballType.FUTSAL]
 
-    matches = []
-    for i in range(num_matches):
-        match = {
+    # Each attribute list is cycled independently, as indexing by i % len(list) would
+    matches = [
+        {
             "matchid": 1000 + i,
-            "installd": statuses[i % len(statuses)] == MatchStatus.CANCELLED,
-            "avbruten": statuses[i % len(statuses)] == MatchStatus.INTERRUPTED,
-            "uppskjuten": statuses[i % len(statuses)] == MatchStatus.POSTPONED,
-            "arslutresultat": statuses[i % len(statuses)] == MatchStatus.COMPLETED,
-            "tavlingAlderskategori": age_categories[i % len(age_categories)].value,
-            "tavlingKonId": genders[i % len(genders)].value,
-            "fotbollstypid": football_types[i % len(football_types)].value,
+            "installd": status == MatchStatus.CANCELLED,
+            "avbruten": status == MatchStatus.INTERRUPTED,
+            "uppskjuten": status == MatchStatus.POSTPONED,
+            "arslutresultat": status == MatchStatus.COMPLETED,
+            "tavlingAlderskategori": age_category.value,
+            "tavlingKonId": gender.value,
+            "fotbollstypid": football_type.value,
         }
-        matches.append(match)
-    return matches
+        for i, status, age_category, gender, football_type in zip(
+            range(num_matches),
+            cycle(statuses),
+            cycle(age_categories),
+            cycle(genders),
+            cycle(football_types),
+        )
+    ]
+    return freeze_matches(matches)
+
+
+def freeze_matches(matches: List[Dict[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+    """Returns a read-only copy of the matches that can be shared between tests."""
+    return tuple(MappingProxyType(match) for match in matches)
 
 
 class TestMatchListFilter(unittest.TestCase):
-    def setUp(self):
-        self.test_matches = create_test_matches(
+    @classmethod
+    def setUpClass(cls):
+        # The dataset is cached and frozen, so no test can mutate it for the others
+        cls.test_matches = create_test_matches(
             num_matches=20
         )  # Create a larger, more diverse dataset
 
@@ -231,7 +252,7 @@ class TestMatchListFilter(unittest.TestCase):
         filtered_matches = match_filter.filter_matches(self.test_matches)
         self.assertEqual(
             filtered_matches,
-            self.test_matches,
+            list(self.test_matches),
             "Expected all matches to be returned when no filter is applied.",
         )
 
@@ -5,7 +5,7 @@ These tests ensure that the parameter names used in the API calls match
 what the FOGIS API expects, preventing regressions in future changes.
 """
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 from fogis_api_client.fogis_api_client import FogisApiClient
 
@@ -21,7 +21,9 @@ class TestParameterNames(unittest.TestCase):
     def test_fetch_team_players_json_parameter_name(self):
         """Test that fetch_team_players_json uses the correct parameter name (matchlagid)."""
         # Mock the _api_request method
-        self.client._api_request = MagicMock(return_value={"spelare": []})
+        self.client._api_request = Mock(
+            spec_set=self.client._api_request, return_value={"spelare": []}
+        )
 
         # Call the method
         self.client.fetch_team_players_json(team_id=123)
@@ -35,7 +37,9 @@ class TestParameterNames(unittest.TestCase):
     def test_fetch_team_officials_json_parameter_name(self):
         """Test that fetch_team_officials_json uses the correct parameter name (matchlagid)."""
         # Mock the _api_request method
-        self.client._api_request = MagicMock(return_value=[])
+        self.client._api_request = Mock(
+            spec_set=self.client._api_request, return_value=[]
+        )
 
         # Call the method
         self.client.fetch_team_officials_json(team_id=123)
@@ -49,7 +53,9 @@ class TestParameterNames(unittest.TestCase):
     def test_report_team_official_action_parameter_name(self):
         """Test that report_team_official_action uses the correct parameter name (lagid)."""
         # Mock the _api_request method
-        self.client._api_request = MagicMock(return_value={"success": True})
+        self.client._api_request = Mock(
+            spec_set=self.client._api_request, return_value={"success": True}
+        )
 
         # Call the method
         action_data = {